@@ -15,8 +15,10 @@ config = context.config
 
 # Set the database URL from our config
 # Note: db_config now uses ConfigManager under the hood (TOML + profiles)
-# but maintains backward compatibility with .env files
-config.set_main_option('sqlalchemy.url', db_config.url)
+# but maintains backward compatibility with .env files.
+# '%' is doubled because the value goes through configparser interpolation
+# (percent-encoded passwords would otherwise raise).
+config.set_main_option('sqlalchemy.url', db_config.url.replace('%', '%%'))
 
 # Interpret the config file for Python logging.
 # This line sets up loggers basically.
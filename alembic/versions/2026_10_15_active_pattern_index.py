@@ -0,0 +1,29 @@
+"""Add partial index for the active setup-pattern dropdowns
+
+Revision ID: 2026_10_15_active_pattern_index
+Revises: 2026_07_29_notepad_entries
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "2026_10_15_active_pattern_index"
+down_revision: Union[str, None] = "2026_07_29_notepad_entries"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The trades list and detail pages fetch a user's active patterns ordered by
+    # name; uq_pattern_per_user is on LOWER(pattern_name) so it can't serve that.
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS ix_setup_patterns_user_active_name
+        ON setup_patterns (user_id, pattern_name)
+        WHERE is_active
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_setup_patterns_user_active_name")
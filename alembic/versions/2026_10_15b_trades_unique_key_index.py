@@ -0,0 +1,29 @@
+"""Index trades.unique_key for the cross-user duplicate check
+
+Revision ID: 2026_10_15b_trades_unique_key_index
+Revises: 2026_10_15_active_pattern_index
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "2026_10_15b_trades_unique_key_index"
+down_revision: Union[str, None] = "2026_10_15_active_pattern_index"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # unique_trade_per_user leads with user_id, so it already serves the
+    # per-user duplicate check but not the cross-user one, which matches on
+    # unique_key alone (the single-column constraint went away with multi-user).
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS ix_trades_unique_key
+        ON trades (unique_key)
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_trades_unique_key")
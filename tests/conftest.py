@@ -9,10 +9,15 @@ from trading_journal.database import get_db_manager
 
 
 class _TestDBConfig:
-    """Minimal config object satisfying DatabaseManager's `config.url` access."""
+    """Minimal config object satisfying DatabaseManager's `config.url` and pool settings access."""
 
     def __init__(self, url: str) -> None:
         self.url = url
+        # Same defaults as DatabaseConfig
+        self.pool_size = 5
+        self.max_overflow = 10
+        self.pool_timeout = 10
+        self.pool_pre_ping = False
 
 
 @pytest.fixture(scope="session")
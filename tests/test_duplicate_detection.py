@@ -363,9 +363,10 @@ class TestDuplicateDetector:
         detector1 = DuplicateDetector(db_session)
         assert detector1.session is not None
 
-        # Without session (creates its own)
-        detector2 = DuplicateDetector()
-        assert detector2.session is not None
+        # Without session (creates its own, released on exit)
+        with DuplicateDetector() as detector2:
+            assert detector2.session is not None
+        assert detector2._session_cm is None
 
 
 class TestDuplicateDetectionIntegration:
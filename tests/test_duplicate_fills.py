@@ -9,6 +9,7 @@ import pytest
 
 from trading_journal.models import User, Trade
 from trading_journal.ingestion import NdjsonIngester
+from trading_journal.schemas import NdjsonRecord
 from trading_journal.authorization import AuthContext
 
 
@@ -135,3 +136,18 @@ def test_reupload_same_file_stays_idempotent(db_session, test_user):
 
     file_path.unlink()
     file_path_2.unlink()
+
+
+def test_untracked_insert_keeps_identical_fills(db_session, test_user):
+    """_insert_records batches every row into one UPSERT, so identical fills
+    need distinct keys there too or Postgres rejects the whole statement."""
+    records = []
+    for i, record in enumerate(mmm_records(), start=1):
+        record.update(section="Filled Orders", row_index=i)
+        records.append(NdjsonRecord.model_validate(record))
+
+    trade_ids = NdjsonIngester()._insert_records(test_user.user_id, records, "dup.ndjson")
+
+    assert len(trade_ids) == 3
+    sells = db_session.query(Trade).filter_by(symbol="MMM", side="SELL").all()
+    assert len(sells) == 2
@@ -0,0 +1,104 @@
+"""Tests for NdjsonIngester validation and batch dry runs (no database needed)."""
+
+import json
+
+import pytest
+
+from trading_journal.auth.base import AuthUser
+from trading_journal.authorization import AuthContext
+from trading_journal.ingestion import NdjsonIngester
+
+
+def _fill(row_index, **overrides):
+    record = {
+        "section": "Filled Orders",
+        "row_index": row_index,
+        "raw": f"raw row {row_index}",
+        "issues": [],
+        "exec_time": "2025-01-15T10:00:00",
+        "side": "BUY",
+        "qty": 100,
+        "pos_effect": "TO OPEN",
+        "symbol": "AAPL",
+        "net_price": 150.25,
+        "event_type": "fill",
+        "asset_type": "STOCK",
+    }
+    record.update(overrides)
+    return record
+
+
+def test_section_headers_and_non_fills_are_skipped():
+    records = [
+        {"section": "Filled Orders", "row_index": 1, "raw": "Filled Orders", "issues": ["section_header"]},
+        _fill(2),
+        _fill(3, event_type="cancel"),
+        _fill(4, event_type="amend"),
+        _fill(5),
+    ]
+
+    successful, errors = NdjsonIngester()._validate_records(records)
+
+    assert [r.row_index for r in successful] == [2, 5]
+    assert errors == []
+
+
+def test_bad_row_in_chunk_is_reported_with_its_row_number():
+    ingester = NdjsonIngester()
+    ingester.VALIDATION_CHUNK_SIZE = 3
+    records = [_fill(1), _fill(2), _fill(3, side="HOLD"), _fill(4), _fill(5)]
+
+    successful, errors = ingester._validate_records(records)
+
+    assert [r.row_index for r in successful] == [1, 2, 4, 5]
+    assert len(errors) == 1
+    assert errors[0].startswith("Row 3:")
+
+
+def test_null_issues_is_a_row_error_not_a_crash():
+    successful, errors = NdjsonIngester()._validate_records(
+        [_fill(1), _fill(2, issues=None)]
+    )
+
+    assert [r.row_index for r in successful] == [1]
+    assert len(errors) == 1
+    assert errors[0].startswith("Row 2:")
+
+
+def test_non_object_rows_are_reported():
+    successful, errors = NdjsonIngester()._validate_records([_fill(1), [1, 2], "text"])
+
+    assert [r.row_index for r in successful] == [1]
+    assert errors == [
+        "Record 2: expected a JSON object, got list",
+        "Record 3: expected a JSON object, got str",
+    ]
+
+
+@pytest.fixture
+def auth_user():
+    AuthContext.set_current_user(AuthUser(
+        user_id=1, username="batch_user", email="batch_user@example.com",
+        is_admin=False, is_active=True, auth_method="api_key",
+    ))
+    yield
+    AuthContext.clear()
+
+
+def test_process_batch_dry_run_over_two_files(tmp_path, monkeypatch, auth_user):
+    (tmp_path / "a.ndjson").write_text(
+        "\n".join(json.dumps(r) for r in [_fill(1), _fill(2, side="HOLD")]) + "\n"
+    )
+    (tmp_path / "b.ndjson").write_text(
+        "\n".join(json.dumps(r) for r in [_fill(1), _fill(2), _fill(3)]) + "\n"
+    )
+    monkeypatch.chdir(tmp_path)
+
+    result = NdjsonIngester().process_batch("*.ndjson", dry_run=True, skip_duplicate_check=True)
+
+    assert result["dry_run"] is True
+    assert [r["file_path"] for r in result["results"]] == [
+        str(tmp_path / "a.ndjson"), str(tmp_path / "b.ndjson")
+    ]
+    assert result["total_records_processed"] == 4
+    assert result["total_records_failed"] == 1
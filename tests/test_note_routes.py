@@ -0,0 +1,78 @@
+"""Route tests for saving journal notes and notepad entries from the web UI."""
+
+import pytest
+
+from trading_journal.models import JournalNote, NotepadEntry, User
+from trading_journal.web import create_app
+
+
+@pytest.fixture
+def user(db_session):
+    user = User(
+        username="note_route_user",
+        email="note_route_user@example.com",
+        auth_method="api_key",
+        is_active=True,
+        timezone="US/Eastern",
+    )
+    db_session.add(user)
+    db_session.commit()
+    return user
+
+
+@pytest.fixture
+def client(db_engine, user):
+    app = create_app()
+    app.config['TESTING'] = True
+    client = app.test_client()
+    with client.session_transaction() as flask_session:
+        flask_session['user_id'] = user.user_id
+    return client
+
+
+def test_journal_note_edit_is_saved(db_session, client, user):
+    note = JournalNote(user_id=user.user_id, title="Old title", body="Old body")
+    db_session.add(note)
+    db_session.commit()
+
+    response = client.post(f"/journal/{note.note_id}", data={'title': "New title", 'body': "New body"})
+
+    assert response.status_code == 302
+    assert response.headers['Location'].endswith(f"/journal/{note.note_id}")
+    db_session.refresh(note)
+    assert note.title == "New title"
+    assert note.body == "New body"
+
+
+def test_notepad_entry_edit_is_saved(db_session, client, user):
+    entry = NotepadEntry(user_id=user.user_id, symbol="AAPL", body="Old thought.")
+    db_session.add(entry)
+    db_session.commit()
+
+    response = client.post(
+        f"/notepad/{entry.notepad_id}",
+        data={'symbol': "msft", 'account_id': "", 'body': "New thought."},
+    )
+
+    assert response.status_code == 302
+    assert response.headers['Location'].endswith(f"/notepad/{entry.notepad_id}")
+    db_session.refresh(entry)
+    assert entry.symbol == "MSFT"
+    assert entry.body == "New thought."
+
+
+def test_journal_note_edit_ignores_other_users_notes(db_session, client, user):
+    other = User(username="note_route_other", email="note_route_other@example.com",
+                 auth_method="api_key", is_active=True)
+    db_session.add(other)
+    db_session.commit()
+    note = JournalNote(user_id=other.user_id, title="Theirs", body="Theirs")
+    db_session.add(note)
+    db_session.commit()
+
+    response = client.post(f"/journal/{note.note_id}", data={'title': "Mine", 'body': "Mine"})
+
+    assert response.status_code == 302
+    assert response.headers['Location'].endswith("/journal/")
+    db_session.refresh(note)
+    assert note.title == "Theirs"
@@ -270,6 +270,54 @@ class TestTradeFiltering:
         assert result["total_trades"] == 1
         assert result["trades"][0]["symbol"] == "MSFT"
 
+    def test_get_trades_keyset_pagination(self, db_session, multi_date_trades, setup_auth):
+        """Test paging through trades newest-first with limit/after_id."""
+        engine = TradeCompletionEngine()
+        first = engine.get_completed_trades_summary(limit=3)
+
+        # Summary stats cover every matching trade, not just the page
+        assert first["total_trades"] == 4
+        assert [t["symbol"] for t in first["trades"]] == ["GOOGL", "TSLA", "MSFT"]
+        assert first["next_after_id"] == first["trades"][-1]["id"]
+
+        second = engine.get_completed_trades_summary(limit=3, after_id=first["next_after_id"])
+        assert [t["symbol"] for t in second["trades"]] == ["AAPL"]
+        assert second["next_after_id"] is None
+
+    def test_get_trades_keyset_pagination_with_null_opened_at(self, db_session, multi_date_trades, setup_auth):
+        """Trades without opened_at page by closed_at; trades with neither come last."""
+        user_id = multi_date_trades["user1_trades"][0].user_id
+        for symbol, closed_at in [("AMD", datetime(2025, 11, 26, 12, 0)), ("META", None), ("NFLX", None)]:
+            db_session.add(CompletedTrade(
+                user_id=user_id,
+                symbol=symbol,
+                instrument_type="EQUITY",
+                total_qty=10,
+                entry_avg_price=Decimal("100.00"),
+                exit_avg_price=Decimal("101.00"),
+                gross_proceeds=Decimal("1010.00"),
+                gross_cost=Decimal("1000.00"),
+                net_pnl=Decimal("10.00"),
+                opened_at=None,
+                closed_at=closed_at,
+                trade_type="LONG",
+                is_winning_trade=True
+            ))
+        db_session.commit()
+
+        engine = TradeCompletionEngine()
+        symbols = []
+        after_id = None
+        while True:
+            page = engine.get_completed_trades_summary(limit=2, after_id=after_id)
+            symbols.extend(t["symbol"] for t in page["trades"])
+            after_id = page["next_after_id"]
+            if after_id is None:
+                break
+
+        # META and NFLX tie on a NULL key, so they come back by descending id
+        assert symbols == ["GOOGL", "TSLA", "AMD", "MSFT", "AAPL", "NFLX", "META"]
+
     def test_user_isolation_strict(self, db_session, multi_date_trades, user2):
         """Test that switching users shows only that user's trades."""
         # First check user1's trades (already authenticated in setup_auth)
@@ -3,6 +3,8 @@
 import zoneinfo
 from datetime import datetime, timezone as dt_timezone
 
+from sqlalchemy import and_, case, or_
+
 from .models import CompletedTrade, NotepadEntry, TradeAnnotation, User
 
 
@@ -13,17 +15,20 @@ def get_or_create_annotation(session, trade: CompletedTrade) -> TradeAnnotation:
     (user_id, symbol, opened_at) to handle the case where a completed_trades
     rebuild has NULLed the FK but the annotation row still exists.
     """
-    ann = session.query(TradeAnnotation).filter_by(
-        completed_trade_id=trade.completed_trade_id
-    ).one_or_none()
-    if ann is None:
-        ann = session.query(TradeAnnotation).filter_by(
-            user_id=trade.user_id,
-            symbol=trade.symbol,
-            opened_at=trade.opened_at,
-        ).one_or_none()
-        if ann is not None:
-            ann.completed_trade_id = trade.completed_trade_id
+    # One round trip for both lookups; the FK match sorts ahead of a natural-key match.
+    linked = TradeAnnotation.completed_trade_id == trade.completed_trade_id
+    ann = session.query(TradeAnnotation).filter(
+        or_(
+            linked,
+            and_(
+                TradeAnnotation.user_id == trade.user_id,
+                TradeAnnotation.symbol == trade.symbol,
+                TradeAnnotation.opened_at == trade.opened_at,
+            ),
+        )
+    ).order_by(case((linked, 0), else_=1)).first()
+    if ann is not None and ann.completed_trade_id != trade.completed_trade_id:
+        ann.completed_trade_id = trade.completed_trade_id
     if ann is None:
         ann = TradeAnnotation(
             completed_trade_id=trade.completed_trade_id,
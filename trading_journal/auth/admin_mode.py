@@ -1,5 +1,6 @@
 """Admin mode for development and testing convenience."""
 
+import functools
 import os
 import logging
 from typing import Optional
@@ -18,10 +19,14 @@ class AdminModeAuth:
     """
 
     @staticmethod
+    @functools.lru_cache(maxsize=1)
     def is_enabled() -> bool:
         """
         Check if admin mode is enabled via environment variable.
 
+        The environment is read once per process; tests that toggle
+        ADMIN_MODE_ENABLED should call AdminModeAuth.is_enabled.cache_clear().
+
         Returns:
             True if admin mode is enabled, False otherwise.
         """
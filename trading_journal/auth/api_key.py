@@ -11,7 +11,7 @@ from .exceptions import (
     UserNotFoundError,
     UserInactiveError,
 )
-from .utils import verify_api_key
+from .utils import hash_api_key
 from ..models import User
 
 
@@ -88,17 +88,12 @@ class APIKeyAuthenticationProvider(AuthenticationProvider):
         Returns:
             User if found, None otherwise.
         """
-        # Get all users with API keys
-        users = self.session.query(User).filter(
-            User.api_key_hash.isnot(None)
-        ).all()
-
-        # Verify the API key against each user's hash
-        for user in users:
-            if verify_api_key(api_key, user.api_key_hash):
-                return user
-
-        return None
+        # api_key_hash is a deterministic SHA256 with a unique index, so hash
+        # once and let the database do a single indexed lookup rather than
+        # loading every keyed user and comparing hashes in Python.
+        return self.session.query(User).filter(
+            User.api_key_hash == hash_api_key(api_key)
+        ).one_or_none()
 
     def _user_to_auth_user(self, user: User) -> AuthUser:
         """
@@ -59,6 +59,19 @@ class AuthContext:
             )
         return user
 
+    @staticmethod
+    def require_user_id() -> int:
+        """
+        Get the current user's ID, raising an error if not authenticated.
+
+        Returns:
+            User ID of the authenticated user.
+
+        Raises:
+            RuntimeError: If no user is authenticated.
+        """
+        return AuthContext.require_user().user_id
+
     @staticmethod
     def is_authenticated() -> bool:
         """
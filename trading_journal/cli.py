@@ -1,42 +1,47 @@
 """Command-line interface for trading journal."""
 
-import json
+import functools
+import io
 import logging
 from pathlib import Path
 
 import click
-from alembic import command
-from alembic.config import Config
-from sqlalchemy import text
 
-from .database import db_manager
+# Heavy dependencies (alembic, SQLAlchemy, the ORM models, the database engine,
+# the setup wizard, json/csv) are imported inside the commands that use them so that `--help` and other
+# read-only invocations don't pay for them at startup.
 from .config import logging_config
 from .config_manager import get_config_manager
-from .setup_wizard import run_wizard
-from .models import CompletedTrade
-from .cli_auth import require_authentication, AuthContext
-from .user_management import UserManager
+from .cli_auth import require_admin, require_authentication
 from .report_configs import (
     TRADE_COLUMN_DEFS,
     TRADE_REPORT_LAYOUTS,
+    TRADE_SORTABLE_COLUMNS,
 )
 
 
-# Set up logging
-# Ensure log directory exists
-log_file_path = Path(logging_config.file)
-log_file_path.parent.mkdir(parents=True, exist_ok=True)
+logger = logging.getLogger(__name__)
 
-logging.basicConfig(
-    level=getattr(logging, logging_config.level),
-    format=logging_config.format,
-    handlers=[
-        logging.FileHandler(logging_config.file),
-        logging.StreamHandler()
-    ]
-)
 
-logger = logging.getLogger(__name__)
+def _configure_logging() -> None:
+    """Set up file + console logging once a command is actually going to run.
+
+    Kept out of module import so `--help` and similar invocations neither load
+    the config nor touch the log file. The file handler is opened lazily on
+    the first record written.
+    """
+    # Ensure log directory exists
+    log_file_path = Path(logging_config.file)
+    log_file_path.parent.mkdir(parents=True, exist_ok=True)
+
+    logging.basicConfig(
+        level=getattr(logging, logging_config.level),
+        format=logging_config.format,
+        handlers=[
+            logging.FileHandler(logging_config.file, delay=True),
+            logging.StreamHandler()
+        ]
+    )
 
 
 @click.group(invoke_without_command=True)
@@ -66,6 +71,7 @@ def main(ctx: click.Context, overview: bool) -> None:
         ctx.exit(0)
 
     ctx.ensure_object(dict)
+    _configure_logging()
 
     # Check if we're running a config command (skip config check for those)
     if ctx.invoked_subcommand in ['config']:
@@ -84,6 +90,7 @@ def main(ctx: click.Context, overview: bool) -> None:
             click.echo("  $ trading-journal config setup")
 
             if click.confirm("\nRun setup wizard now?", default=True):
+                from .setup_wizard import run_wizard
                 if run_wizard():
                     click.echo("\n✓ Configuration created successfully!")
                     get_config_manager(reset=True)
@@ -103,6 +110,8 @@ def config() -> None:
 @click.option('--force', is_flag=True, help='Force reconfiguration even if config exists')
 def config_setup(force: bool) -> None:
     """Run interactive setup wizard."""
+    from .setup_wizard import run_wizard
+
     try:
         if run_wizard(force=force):
             click.echo("\n✅ Configuration setup completed successfully")
@@ -135,6 +144,7 @@ def config_show(ctx: click.Context, profile: str, format: str) -> None:
         active_profile = config_manager.get_active_profile()
 
         if format == 'json':
+            import json
             # Convert to JSON (mask password)
             config_copy = full_config.copy()
             if 'database' in config_copy and 'password' in config_copy['database']:
@@ -260,6 +270,7 @@ def config_migrate() -> None:
         pnl_method = env_values.get("PNL_METHOD", "average_cost")
 
         # Create wizard with prepopulated values
+        from .setup_wizard import run_wizard
         wizard = run_wizard(force=False)
 
         if wizard:
@@ -283,12 +294,20 @@ def db() -> None:
     pass
 
 
+@functools.lru_cache(maxsize=1)
+def _alembic_config():
+    """Parse alembic.ini once per process and share it between db commands."""
+    from alembic.config import Config
+    return Config("alembic.ini")
+
+
 @db.command()
 def migrate() -> None:
     """Run database migrations."""
+    from alembic import command
+
     try:
-        alembic_cfg = Config("alembic.ini")
-        command.upgrade(alembic_cfg, "head")
+        command.upgrade(_alembic_config(), "head")
         click.echo("✅ Database migrations completed successfully")
     except Exception as e:
         click.echo(f"❌ Migration failed: {e}")
@@ -298,14 +317,16 @@ def migrate() -> None:
 @db.command()
 def status() -> None:
     """Check database connection and migration status."""
+    from alembic import command
+    from .database import db_manager
+
     try:
         if db_manager.test_connection():
             click.echo("✅ Database connection: OK")
         else:
             click.echo("❌ Database connection: FAILED")
             raise click.Abort()
-        alembic_cfg = Config("alembic.ini")
-        command.current(alembic_cfg)
+        command.current(_alembic_config())
     except Exception as e:
         click.echo(f"❌ Status check failed: {e}")
         raise click.Abort()
@@ -315,6 +336,8 @@ def status() -> None:
 @click.option('--confirm', is_flag=True, help='Confirm database reset')
 def reset(confirm: bool) -> None:
     """Reset database (drop all tables)."""
+    from .database import db_manager
+
     if not confirm:
         if not click.confirm('This will delete ALL data. Are you sure?'):
             click.echo("Operation cancelled")
@@ -330,14 +353,21 @@ def reset(confirm: bool) -> None:
 @db.command("verify-schema")
 def verify_schema() -> None:
     """Verify database schema constraints for multi-user support."""
+    from sqlalchemy import text
+    from .database import db_manager
+
     try:
         with db_manager.engine.connect() as conn:
-            # Check trades table constraints
+            # Check trades table constraints (pg_constraint directly; the
+            # information_schema view joins far more catalogs than we need)
             result = conn.execute(text("""
-                SELECT constraint_name, constraint_type
-                FROM information_schema.table_constraints
-                WHERE table_name = 'trades'
-                AND constraint_name IN ('unique_trade_per_user', 'trades_unique_key_key')
+                SELECT conname,
+                       CASE contype WHEN 'u' THEN 'UNIQUE'
+                                    WHEN 'p' THEN 'PRIMARY KEY'
+                                    ELSE contype::text END
+                FROM pg_catalog.pg_constraint
+                WHERE conrelid = to_regclass('public.trades')
+                AND conname IN ('unique_trade_per_user', 'trades_unique_key_key')
             """))
             constraints = result.fetchall()
 
@@ -400,7 +430,7 @@ def process_trades(symbol: str, reprocess: bool) -> None:
         from .authorization import AuthContext
         engine = TradeCompletionEngine()
         if reprocess:
-            user_id = AuthContext.require_user().user_id
+            user_id = AuthContext.require_user_id()
             result = engine.reprocess_all_completed_trades(user_id)
         else:
             result = engine.process_completed_trades(symbol)
@@ -492,18 +522,52 @@ def trades() -> None:
 @require_authentication
 def show_trade(id: int) -> None:
     """Show details for a single completed trade and its executions."""
+    from .authorization import AuthContext
+    from .database import db_manager
+    from .models import CompletedTrade, SetupPattern, Trade, TradeAnnotation
+
     try:
-        user_id = AuthContext.require_user().user_id
+        user_id = AuthContext.require_user_id()
         with db_manager.get_session() as session:
-            trade = session.query(CompletedTrade).filter_by(
-                completed_trade_id=id,
-                user_id=user_id
+            # Project only the displayed columns; the annotation and pattern
+            # name come from outer joins rather than relationship loads.
+            trade = session.query(
+                CompletedTrade.completed_trade_id,
+                CompletedTrade.symbol,
+                CompletedTrade.instrument_type,
+                CompletedTrade.trade_type,
+                CompletedTrade.total_qty,
+                CompletedTrade.net_pnl,
+                CompletedTrade.opened_at,
+                CompletedTrade.closed_at,
+                CompletedTrade.hold_duration,
+                SetupPattern.pattern_name,
+                TradeAnnotation.trade_notes,
+            ).outerjoin(
+                TradeAnnotation,
+                TradeAnnotation.completed_trade_id == CompletedTrade.completed_trade_id
+            ).outerjoin(
+                SetupPattern,
+                SetupPattern.pattern_id == TradeAnnotation.setup_pattern_id
+            ).filter(
+                CompletedTrade.completed_trade_id == id,
+                CompletedTrade.user_id == user_id
             ).one_or_none()
 
             if not trade:
                 click.echo(f"❌ Error: Completed trade with ID {id} not found.", err=True)
                 raise click.Abort()
 
+            executions = session.query(
+                Trade.exec_timestamp,
+                Trade.side,
+                Trade.qty,
+                Trade.net_price,
+            ).filter(
+                Trade.completed_trade_id == id,
+                Trade.user_id == user_id
+            ).order_by(Trade.exec_timestamp).all()
+
             click.echo(f"📋 Details for Completed Trade ID: {trade.completed_trade_id}")
             click.echo(f"   Symbol: {trade.symbol} ({trade.instrument_type})")
             click.echo(f"   Type: {trade.trade_type}")
@@ -512,12 +576,11 @@ def show_trade(id: int) -> None:
             click.echo(f"   Opened: {trade.opened_at}")
             click.echo(f"   Closed: {trade.closed_at}")
             click.echo(f"   Duration: {trade.hold_duration}")
-            _ann = trade.trade_annotation
-            click.echo(f"   Pattern: {_ann.setup_pattern_rel.pattern_name if _ann and _ann.setup_pattern_rel else 'N/A'}")
-            click.echo(f"   Notes: {(_ann.trade_notes if _ann else None) or 'N/A'}")
-            
+            click.echo(f"   Pattern: {trade.pattern_name or 'N/A'}")
+            click.echo(f"   Notes: {trade.trade_notes or 'N/A'}")
+
             click.echo("\n   Executions:")
-            for exec in sorted(trade.executions, key=lambda e: e.exec_timestamp):
+            for exec in executions:
                 click.echo(f"      - {exec.exec_timestamp} | {exec.side} {exec.qty} @ {exec.net_price:.4f}")
 
     except Exception as e:
@@ -569,98 +632,100 @@ def dashboard(date_range: str, symbol: str) -> None:
 
 
 def _display_dashboard_summary(data: dict, detailed: bool = False) -> None:
-    """Display dashboard in formatted text output."""
-    click.echo("\n" + "="*70)
-    click.echo("📊 TRADING DASHBOARD")
-    click.echo("="*70)
+    """Display dashboard in formatted text output (emitted as a single write)."""
+    buf = io.StringIO()
+    buf.write("\n" + "="*70 + "\n")
+    buf.write("📊 TRADING DASHBOARD\n")
+    buf.write("="*70 + "\n")
 
     # Period info
     period = data.get("period", {})
-    click.echo(f"\n📅 Period:")
+    buf.write(f"\n📅 Period:\n")
     if period.get("start_date") and period.get("end_date"):
-        click.echo(f"   {period['start_date']} to {period['end_date']}")
+        buf.write(f"   {period['start_date']} to {period['end_date']}\n")
     elif period.get("first_trade") and period.get("last_trade"):
-        click.echo(f"   {period['first_trade'][:10]} to {period['last_trade'][:10]}")
+        buf.write(f"   {period['first_trade'][:10]} to {period['last_trade'][:10]}\n")
     else:
-        click.echo(f"   All time")
+        buf.write(f"   All time\n")
     if period.get("symbol"):
-        click.echo(f"   Symbol: {period['symbol']}")
+        buf.write(f"   Symbol: {period['symbol']}\n")
 
     # Core metrics
     core = data.get("core_metrics", {})
     if core:
-        click.echo(f"\n💰 Performance Summary:")
-        click.echo(f"   Total Trades: {core['total_trades']}")
-        click.echo(f"   Winning Trades: {core['winning_trades']} ({core['win_rate_pct']:.1f}%)")
-        click.echo(f"   Losing Trades: {core['losing_trades']}")
-        click.echo(f"\n   Total P&L: ${core['total_pnl']:,.2f}")
+        buf.write(f"\n💰 Performance Summary:\n")
+        buf.write(f"   Total Trades: {core['total_trades']}\n")
+        buf.write(f"   Winning Trades: {core['winning_trades']} ({core['win_rate_pct']:.1f}%)\n")
+        buf.write(f"   Losing Trades: {core['losing_trades']}\n")
+        buf.write(f"\n   Total P&L: ${core['total_pnl']:,.2f}\n")
 
         # Color code P&L
         pnl_color = "🟢" if core['total_pnl'] > 0 else "🔴"
-        click.echo(f"   {pnl_color} Net Result: ${core['total_pnl']:,.2f}")
+        buf.write(f"   {pnl_color} Net Result: ${core['total_pnl']:,.2f}\n")
 
-        click.echo(f"\n   Average Win: ${core['average_win']:,.2f}")
-        click.echo(f"   Average Loss: ${core['average_loss']:,.2f}")
-        click.echo(f"   Average Trade: ${core['average_trade']:,.2f}")
+        buf.write(f"\n   Average Win: ${core['average_win']:,.2f}\n")
+        buf.write(f"   Average Loss: ${core['average_loss']:,.2f}\n")
+        buf.write(f"   Average Trade: ${core['average_trade']:,.2f}\n")
 
         if core.get('profit_factor'):
-            click.echo(f"   Profit Factor: {core['profit_factor']:.2f}")
+            buf.write(f"   Profit Factor: {core['profit_factor']:.2f}\n")
 
-        click.echo(f"\n   Largest Win: ${core['largest_win']:,.2f}")
-        click.echo(f"   Largest Loss: ${core['largest_loss']:,.2f}")
+        buf.write(f"\n   Largest Win: ${core['largest_win']:,.2f}\n")
+        buf.write(f"   Largest Loss: ${core['largest_loss']:,.2f}\n")
 
-        click.echo(f"\n   Max Win Streak: {core['max_win_streak']}")
-        click.echo(f"   Max Loss Streak: {core['max_loss_streak']}")
+        buf.write(f"\n   Max Win Streak: {core['max_win_streak']}\n")
+        buf.write(f"   Max Loss Streak: {core['max_loss_streak']}\n")
 
     # Max drawdown
     dd = data.get("max_drawdown", {})
     if dd and dd.get("max_drawdown") != 0:
-        click.echo(f"\n📉 Risk Metrics:")
-        click.echo(f"   Max Drawdown: ${dd['max_drawdown']:,.2f} ({dd['max_drawdown_pct']:.2f}%)")
+        buf.write(f"\n📉 Risk Metrics:\n")
+        buf.write(f"   Max Drawdown: ${dd['max_drawdown']:,.2f} ({dd['max_drawdown_pct']:.2f}%)\n")
         if dd.get('peak_date'):
-            click.echo(f"   Peak: ${dd['peak_value']:,.2f} on {dd['peak_date'][:10]}")
-            click.echo(f"   Trough: ${dd['trough_value']:,.2f} on {dd['trough_date'][:10]}")
+            buf.write(f"   Peak: ${dd['peak_value']:,.2f} on {dd['peak_date'][:10]}\n")
+            buf.write(f"   Trough: ${dd['trough_value']:,.2f} on {dd['trough_date'][:10]}\n")
 
     # Pattern analysis
     patterns = data.get("pattern_analysis", {})
     if patterns and patterns.get("by_pattern"):
-        click.echo(f"\n🎯 Pattern Analysis:")
+        buf.write(f"\n🎯 Pattern Analysis:\n")
 
         top_pattern = patterns.get("top_pattern")
         worst_pattern = patterns.get("worst_pattern")
 
         if top_pattern:
-            click.echo(f"   🥇 Best Pattern: {top_pattern['pattern']}")
-            click.echo(f"      Trades: {top_pattern['total_trades']}, P&L: ${top_pattern['total_pnl']:,.2f}, Win Rate: {top_pattern['win_rate_pct']:.1f}%")
+            buf.write(f"   🥇 Best Pattern: {top_pattern['pattern']}\n")
+            buf.write(f"      Trades: {top_pattern['total_trades']}, P&L: ${top_pattern['total_pnl']:,.2f}, Win Rate: {top_pattern['win_rate_pct']:.1f}%\n")
 
         if worst_pattern and worst_pattern != top_pattern:
-            click.echo(f"   🥉 Worst Pattern: {worst_pattern['pattern']}")
-            click.echo(f"      Trades: {worst_pattern['total_trades']}, P&L: ${worst_pattern['total_pnl']:,.2f}, Win Rate: {worst_pattern['win_rate_pct']:.1f}%")
+            buf.write(f"   🥉 Worst Pattern: {worst_pattern['pattern']}\n")
+            buf.write(f"      Trades: {worst_pattern['total_trades']}, P&L: ${worst_pattern['total_pnl']:,.2f}, Win Rate: {worst_pattern['win_rate_pct']:.1f}%\n")
 
         if detailed:
-            click.echo(f"\n   All Patterns:")
+            buf.write(f"\n   All Patterns:\n")
             for pattern in patterns["by_pattern"]:
-                click.echo(f"   • {pattern['pattern']}: {pattern['total_trades']} trades, ${pattern['total_pnl']:,.2f} P&L, {pattern['win_rate_pct']:.1f}% win rate")
+                buf.write(f"   • {pattern['pattern']}: {pattern['total_trades']} trades, ${pattern['total_pnl']:,.2f} P&L, {pattern['win_rate_pct']:.1f}% win rate\n")
 
     # Position summary
     positions = data.get("positions", {})
     if positions:
-        click.echo(f"\n💼 Position Summary:")
-        click.echo(f"   Open Positions: {positions['open_positions']}")
-        click.echo(f"   Closed Positions: {positions['closed_positions']}")
-        click.echo(f"   Total Open Value: ${positions['total_open_value']:,.2f}")
-        click.echo(f"   Total Realized P&L: ${positions['total_realized_pnl']:,.2f}")
+        buf.write(f"\n💼 Position Summary:\n")
+        buf.write(f"   Open Positions: {positions['open_positions']}\n")
+        buf.write(f"   Closed Positions: {positions['closed_positions']}\n")
+        buf.write(f"   Total Open Value: ${positions['total_open_value']:,.2f}\n")
+        buf.write(f"   Total Realized P&L: ${positions['total_realized_pnl']:,.2f}\n")
 
     # Equity curve (detailed only)
     if detailed:
         curve = data.get("equity_curve", [])
         if curve:
-            click.echo(f"\n📈 Recent Equity Curve (last 10 trades):")
+            buf.write(f"\n📈 Recent Equity Curve (last 10 trades):\n")
             for point in curve[-10:]:
                 trade_result = "🟢" if point['trade_pnl'] > 0 else "🔴"
-                click.echo(f"   {point['timestamp'][:10]} | {point['symbol']:6} | {trade_result} ${point['trade_pnl']:8,.2f} | Cumulative: ${point['cumulative_pnl']:,.2f}")
+                buf.write(f"   {point['timestamp'][:10]} | {point['symbol']:6} | {trade_result} ${point['trade_pnl']:8,.2f} | Cumulative: ${point['cumulative_pnl']:,.2f}\n")
 
-    click.echo("\n" + "="*70 + "\n")
+    buf.write("\n" + "="*70 + "\n\n")
+    click.echo(buf.getvalue(), nl=False)
 
 
 @report.command()
@@ -673,8 +738,11 @@ def _display_dashboard_summary(data: dict, detailed: bool = False) -> None:
     'Date range filter. Formats: "today", "7d" (last 7 days), '
     '"YYYY-MM-DD/YYYY-MM-DD", "YYYY-MM-DD/" (to today), "/YYYY-MM-DD" (up to date).'
 ))
+@click.option('--limit', type=click.IntRange(min=0), default=200, show_default=True,
+              help='Maximum number of trades to list, newest first (0 for no limit)')
+@click.option('--after-id', type=int, help='Continue listing after this trade ID (from a previous page)')
 @require_authentication
-def trades(report_name: str, symbol: str, date_range: str) -> None:
+def trades(report_name: str, symbol: str, date_range: str, limit: int, after_id: int) -> None:
     """List completed trades using a named report layout."""
     try:
         from .trade_completion import TradeCompletionEngine
@@ -692,11 +760,17 @@ def trades(report_name: str, symbol: str, date_range: str) -> None:
                 raise click.Abort()
 
         engine = TradeCompletionEngine()
-        summary = engine.get_completed_trades_summary(
-            symbol=symbol,
-            start_date=start_date,
-            end_date=end_date
-        )
+        try:
+            summary = engine.get_completed_trades_summary(
+                symbol=symbol,
+                start_date=start_date,
+                end_date=end_date,
+                limit=limit or None,
+                after_id=after_id,
+            )
+        except ValueError as e:
+            click.echo(f"❌ {e}", err=True)
+            raise click.Abort()
         if "message" in summary:
             click.echo(summary["message"])
             return
@@ -756,35 +830,38 @@ def trades(report_name: str, symbol: str, date_range: str) -> None:
                 return 0
 
             sort_key_list = [k.lower() for k in layout_sort]
+            invalid = sorted(set(sort_key_list) - TRADE_SORTABLE_COLUMNS)
+            if invalid:
+                click.echo(f"❌ Invalid sort column(s) in layout '{report_name}': {', '.join(invalid)}", err=True)
+                raise click.Abort()
             trades_list = sorted(trades_list, key=lambda t: tuple(_sort_value(t, k) for k in sort_key_list))
 
-        click.echo("📋 Completed Trades Report")
+        # Build the whole report in memory and emit it with a single write
+        buf = io.StringIO()
+        buf.write("📋 Completed Trades Report\n")
         if symbol:
-            click.echo(f"Symbol: {symbol}")
+            buf.write(f"Symbol: {symbol}\n")
         if date_range:
-            click.echo(f"Date Range: {date_range}")
-        click.echo(f"\n📊 Summary:")
-        click.echo(f"   Total Trades: {summary['total_trades']}")
-        click.echo(f"   Winning Trades: {summary['winning_trades']}")
-        click.echo(f"   Losing Trades: {summary['losing_trades']}")
-        click.echo(f"   Win Rate: {summary['win_rate']:.1f}%")
-        click.echo(f"   Total P&L: ${summary['total_pnl']:.2f}")
-        click.echo(f"   Average Win: ${summary['average_win']:.2f}")
-        click.echo(f"   Average Loss: ${summary['average_loss']:.2f}")
-        click.echo(f"\n📋 Trade Details:")
-        # Table header based on layout columns
-        header_cells = []
-        for col_key in layout["columns"]:
-            col_def = TRADE_COLUMN_DEFS.get(col_key)
-            if not col_def:
-                continue
-            label = str(col_def.get("label", col_key))
-            width = int(col_def.get("width", len(label)))
-            align = str(col_def.get("align", "<"))
-            header_cells.append(f"{label:{align}{width}}")
-        click.echo(" | ".join(header_cells))
+            buf.write(f"Date Range: {date_range}\n")
+        buf.write(f"\n📊 Summary:\n")
+        buf.write(f"   Total Trades: {summary['total_trades']}\n")
+        buf.write(f"   Winning Trades: {summary['winning_trades']}\n")
+        buf.write(f"   Losing Trades: {summary['losing_trades']}\n")
+        buf.write(f"   Win Rate: {summary['win_rate']:.1f}%\n")
+        buf.write(f"   Total P&L: ${summary['total_pnl']:.2f}\n")
+        buf.write(f"   Average Win: ${summary['average_win']:.2f}\n")
+        buf.write(f"   Average Loss: ${summary['average_loss']:.2f}\n")
+        buf.write(f"\n📋 Trade Details:\n")
+        # Precompile the header/row template once for the layout; each row is
+        # then a single str.format_map call instead of a per-cell f-string loop.
+        columns = [c for c in layout["columns"] if c in TRADE_COLUMN_DEFS]
+        row_fmt = " | ".join(
+            f"{{{c}:{TRADE_COLUMN_DEFS[c].get('align', '<')}{int(TRADE_COLUMN_DEFS[c].get('width', 8))}}}"
+            for c in columns
+        ) + "\n"
+        buf.write(row_fmt.format_map({c: str(TRADE_COLUMN_DEFS[c].get("label", c)) for c in columns}))
         # Separator line length roughly matches header length
-        click.echo("-" * min(160, sum(int(TRADE_COLUMN_DEFS[c]["width"]) + 3 for c in layout["columns"] if c in TRADE_COLUMN_DEFS)))
+        buf.write("-" * min(160, sum(int(TRADE_COLUMN_DEFS[c]["width"]) + 3 for c in columns)) + "\n")
 
         # Helper to format timestamps
         def _format_ts(ts: str):
@@ -798,56 +875,29 @@ def trades(report_name: str, symbol: str, date_range: str) -> None:
 
         # Table rows
         for trade in trades_list:
-            status_emoji = "🟢" if trade['pnl'] > 0 else "🔴"
-            result_label = "WIN" if trade['pnl'] > 0 else "LOSS"
-            pattern = (trade.get('setup_pattern') or "")[:20]  # setup_pattern from summary dict
-
             open_date, open_time = _format_ts(trade.get('opened_at'))
             close_date, close_time = _format_ts(trade.get('closed_at'))
-            date_str = open_date or close_date
-            entry_time = open_time
-            exit_time = close_time
-
-            row_cells = []
-            for col_key in layout["columns"]:
-                col_def = TRADE_COLUMN_DEFS.get(col_key)
-                if not col_def:
-                    continue
-                width = int(col_def.get("width", 8))
-                align = str(col_def.get("align", "<"))
-
-                if col_key == "id":
-                    value = str(trade.get("id", ""))
-                elif col_key == "symbol":
-                    value = str(trade.get("symbol", ""))
-                elif col_key == "instrument_type":
-                    value = str(trade.get("instrument_type") or "")
-                elif col_key == "type":
-                    value = str(trade.get("type", ""))
-                elif col_key == "qty":
-                    value = str(trade.get("qty") or "")
-                elif col_key == "date":
-                    value = date_str or ""
-                elif col_key == "entm":
-                    value = entry_time or ""
-                elif col_key == "entry":
-                    value = f"{trade.get('entry_price', 0.0):.4f}"
-                elif col_key == "extm":
-                    value = exit_time or ""
-                elif col_key == "exit":
-                    value = f"{trade.get('exit_price', 0.0):.4f}"
-                elif col_key == "pnl":
-                    value = f"{trade.get('pnl', 0.0):.2f}"
-                elif col_key == "result":
-                    value = f"{status_emoji} {result_label}"
-                elif col_key == "pattern":
-                    value = pattern
-                else:
-                    value = ""
-
-                row_cells.append(f"{value:{align}{width}}")
-
-            click.echo(" | ".join(row_cells))
+            buf.write(row_fmt.format_map({
+                "id": str(trade.get("id", "")),
+                "symbol": str(trade.get("symbol", "")),
+                "instrument_type": str(trade.get("instrument_type") or ""),
+                "type": str(trade.get("type", "")),
+                "qty": str(trade.get("qty") or ""),
+                "date": open_date or close_date,
+                "entm": open_time,
+                "entry": f"{trade.get('entry_price', 0.0):.4f}",
+                "extm": close_time,
+                "exit": f"{trade.get('exit_price', 0.0):.4f}",
+                "pnl": f"{trade.get('pnl', 0.0):.2f}",
+                "result": "🟢 WIN" if trade['pnl'] > 0 else "🔴 LOSS",
+                "pattern": (trade.get('setup_pattern') or "")[:20],  # setup_pattern from summary dict
+            }))
+
+        if summary.get("next_after_id") is not None:
+            buf.write(f"\nShowing {len(trades_list)} of {summary['total_trades']} trades. "
+                      f"Next page: --after-id={summary['next_after_id']}\n")
+
+        click.echo(buf.getvalue(), nl=False)
     except Exception as e:
         click.echo(f"❌ Trade listing failed: {e}")
         raise click.Abort()
@@ -890,6 +940,10 @@ def positions(open_only: bool, symbol: str) -> None:
 
 
 
+# Row template for `users list` (username/email truncated to their column width)
+_USER_TABLE_ROW = "{!s:<8} | {:<20.20} | {:<30.30} | {:<6} | {:<7} | {!s:<7} | {:<20}\n"
+
+
 @main.group()
 def users() -> None:
     """User management commands (admin-only)."""
@@ -899,67 +953,72 @@ def users() -> None:
 @users.command("list")
 @click.option('--all', 'include_inactive', is_flag=True, help='Include inactive users')
 @click.option('--format', 'output_format', type=click.Choice(['table', 'json', 'csv']), default='table', help='Output format')
-@require_authentication
+@require_admin
 def list_users(include_inactive: bool, output_format: str) -> None:
     """List all users with trade counts."""
-    # Check admin
-    if not AuthContext.is_admin():
-        click.echo("❌ Error: This command requires administrator privileges.", err=True)
-        raise click.Abort()
+    from .database import db_manager
+    from .user_management import UserManager
 
     try:
         with db_manager.get_session() as session:
             manager = UserManager(session)
-            users_list = manager.list_users(include_inactive=include_inactive)
 
             if output_format == 'json':
                 import json
-                output = {
-                    'users': users_list,
-                    'total_users': len(users_list),
-                    'showing_inactive': include_inactive
-                }
-                click.echo(json.dumps(output, indent=2, default=str))
+                # Stream the users array one object at a time; the document is
+                # byte-for-byte what json.dumps(output, indent=2) would produce.
+                total_users = 0
+                click.echo('{\n  "users": [', nl=False)
+                for user in manager.iter_users(include_inactive=include_inactive):
+                    user_json = json.dumps(user, indent=2, default=str).replace('\n', '\n    ')
+                    click.echo(f"{',' if total_users else ''}\n    {user_json}", nl=False)
+                    total_users += 1
+                click.echo('\n  ]' if total_users else ']', nl=False)
+                click.echo(f',\n  "total_users": {total_users},\n'
+                           f'  "showing_inactive": {json.dumps(include_inactive)}\n}}')
             elif output_format == 'csv':
                 import csv
                 import sys
-                writer = csv.DictWriter(sys.stdout, fieldnames=[
-                    'user_id', 'username', 'email', 'is_active', 'is_admin',
-                    'trade_count', 'created_at', 'last_login_at'
-                ])
-                writer.writeheader()
-                writer.writerows(users_list)
+                writer = csv.writer(sys.stdout)
+                writer.writerow(UserManager.EXPORT_COLUMNS)
+                writer.writerows(manager.stream_user_rows(include_inactive=include_inactive))
             else:  # table format
-                click.echo("\n" + "=" * 80)
-                click.echo("👥 USER MANAGEMENT")
-                click.echo("=" * 80)
+                users_list = manager.list_users(include_inactive=include_inactive)
 
                 active_count = sum(1 for u in users_list if u['is_active'])
                 total_count = len(users_list)
 
+                buf = io.StringIO()
+                buf.write("\n" + "=" * 80 + "\n")
+                buf.write("👥 USER MANAGEMENT\n")
+                buf.write("=" * 80 + "\n")
+
                 if include_inactive:
-                    click.echo(f"\nAll Users ({active_count} active, {total_count - active_count} inactive)")
+                    buf.write(f"\nAll Users ({active_count} active, {total_count - active_count} inactive)\n")
                 else:
-                    click.echo(f"\nActive Users ({active_count} of {total_count} total)")
+                    buf.write(f"\nActive Users ({active_count} of {total_count} total)\n")
 
-                click.echo()
-                click.echo(f"{'User ID':<8} | {'Username':<20} | {'Email':<30} | {'Admin':<6} | {'Active':<7} | {'Trades':<7} | {'Last Login':<20}")
-                click.echo("-" * 80)
+                buf.write("\n")
+                buf.write(_USER_TABLE_ROW.format(
+                    'User ID', 'Username', 'Email', 'Admin', 'Active', 'Trades', 'Last Login'
+                ))
+                buf.write("-" * 80 + "\n")
 
                 for user in users_list:
-                    user_id = str(user['user_id'])
-                    username = user['username'][:20]
-                    email = user['email'][:30]
-                    is_admin = 'Yes' if user['is_admin'] else 'No'
-                    is_active = 'Yes' if user['is_active'] else 'No'
-                    trade_count = str(user['trade_count'])
-                    last_login = user['last_login_at'].strftime('%Y-%m-%d %H:%M') if user['last_login_at'] else 'Never'
-
-                    click.echo(f"{user_id:<8} | {username:<20} | {email:<30} | {is_admin:<6} | {is_active:<7} | {trade_count:<7} | {last_login:<20}")
+                    buf.write(_USER_TABLE_ROW.format(
+                        user['user_id'],
+                        user['username'],
+                        user['email'],
+                        'Yes' if user['is_admin'] else 'No',
+                        'Yes' if user['is_active'] else 'No',
+                        user['trade_count'],
+                        user['last_login_at'].strftime('%Y-%m-%d %H:%M') if user['last_login_at'] else 'Never',
+                    ))
 
                 if not include_inactive:
-                    click.echo(f"\nTo include inactive users: users list --all")
-                click.echo()
+                    buf.write("\nTo include inactive users: users list --all\n")
+                buf.write("\n")
+                click.echo(buf.getvalue(), nl=False)
 
     except Exception as e:
         click.echo(f"❌ User listing failed: {e}", err=True)
@@ -971,15 +1030,13 @@ def list_users(include_inactive: bool, output_format: str) -> None:
 @click.option('--email', prompt=True, help='Email address')
 @click.option('--admin', is_flag=True, help='Grant admin privileges')
 @click.option('--password', default=None, help='Web login password (optional; prompted if omitted)')
-@require_authentication
+@require_admin
 def create_user(username: str, email: str, admin: bool, password: str) -> None:
     """Create a new user with automatic API key generation."""
     from werkzeug.security import generate_password_hash
 
-    # Check admin
-    if not AuthContext.is_admin():
-        click.echo("❌ Error: This command requires administrator privileges.", err=True)
-        raise click.Abort()
+    from .database import db_manager
+    from .user_management import UserManager
 
     # Prompt for password if not supplied
     if password is None:
@@ -1023,13 +1080,11 @@ def create_user(username: str, email: str, admin: bool, password: str) -> None:
 
 @users.command("deactivate")
 @click.option('--user-id', type=int, required=True, help='User ID to deactivate')
-@require_authentication
+@require_admin
 def deactivate_user(user_id: int) -> None:
     """Deactivate a user account."""
-    # Check admin
-    if not AuthContext.is_admin():
-        click.echo("❌ Error: This command requires administrator privileges.", err=True)
-        raise click.Abort()
+    from .database import db_manager
+    from .user_management import UserManager
 
     try:
         with db_manager.get_session() as session:
@@ -1048,13 +1103,11 @@ def deactivate_user(user_id: int) -> None:
 
 @users.command("reactivate")
 @click.option('--user-id', type=int, required=True, help='User ID to reactivate')
-@require_authentication
+@require_admin
 def reactivate_user(user_id: int) -> None:
     """Reactivate a previously deactivated user account."""
-    # Check admin
-    if not AuthContext.is_admin():
-        click.echo("❌ Error: This command requires administrator privileges.", err=True)
-        raise click.Abort()
+    from .database import db_manager
+    from .user_management import UserManager
 
     try:
         with db_manager.get_session() as session:
@@ -1073,13 +1126,11 @@ def reactivate_user(user_id: int) -> None:
 
 @users.command("make-admin")
 @click.option('--user-id', type=int, required=True, help='User ID to grant admin privileges')
-@require_authentication
+@require_admin
 def make_admin(user_id: int) -> None:
     """Grant admin privileges to a user."""
-    # Check admin
-    if not AuthContext.is_admin():
-        click.echo("❌ Error: This command requires administrator privileges.", err=True)
-        raise click.Abort()
+    from .database import db_manager
+    from .user_management import UserManager
 
     try:
         with db_manager.get_session() as session:
@@ -1098,13 +1149,11 @@ def make_admin(user_id: int) -> None:
 
 @users.command("revoke-admin")
 @click.option('--user-id', type=int, required=True, help='User ID to revoke admin privileges')
-@require_authentication
+@require_admin
 def revoke_admin(user_id: int) -> None:
     """Revoke admin privileges from a user."""
-    # Check admin
-    if not AuthContext.is_admin():
-        click.echo("❌ Error: This command requires administrator privileges.", err=True)
-        raise click.Abort()
+    from .database import db_manager
+    from .user_management import UserManager
 
     try:
         with db_manager.get_session() as session:
@@ -1124,13 +1173,11 @@ def revoke_admin(user_id: int) -> None:
 @users.command("delete")
 @click.option('--user-id', type=int, required=True, help='User ID to delete')
 @click.option('--confirm', is_flag=True, help='Skip confirmation prompt')
-@require_authentication
+@require_admin
 def delete_user(user_id: int, confirm: bool) -> None:
     """Delete a user account (prevents deletion if user has trades)."""
-    # Check admin
-    if not AuthContext.is_admin():
-        click.echo("❌ Error: This command requires administrator privileges.", err=True)
-        raise click.Abort()
+    from .database import db_manager
+    from .user_management import UserManager
 
     try:
         with db_manager.get_session() as session:
@@ -1157,13 +1204,11 @@ def delete_user(user_id: int, confirm: bool) -> None:
 
 @users.command("regenerate-key")
 @click.option('--user-id', type=int, required=True, help='User ID to regenerate API key')
-@require_authentication
+@require_admin
 def regenerate_key(user_id: int) -> None:
     """Regenerate a user's API key (invalidates old key)."""
-    # Check admin
-    if not AuthContext.is_admin():
-        click.echo("❌ Error: This command requires administrator privileges.", err=True)
-        raise click.Abort()
+    from .database import db_manager
+    from .user_management import UserManager
 
     try:
         with db_manager.get_session() as session:
@@ -1192,7 +1237,7 @@ def regenerate_key(user_id: int) -> None:
 @click.option('--user-id', type=int, required=True, help='User ID whose data should be purged')
 @click.option('--force', is_flag=True, help='Skip confirmation prompts (dangerous!)')
 @click.option('--dry-run', is_flag=True, help='Preview deletion counts without actually deleting')
-@require_authentication
+@require_admin
 def purge_data(user_id: int, force: bool, dry_run: bool) -> None:
     """
     Purge all data for a specific user (ADMIN ONLY).
@@ -1202,10 +1247,8 @@ def purge_data(user_id: int, force: bool, dry_run: bool) -> None:
 
     ⚠️  WARNING: This operation is IRREVERSIBLE!
     """
-    # Check admin
-    if not AuthContext.is_admin():
-        click.echo("❌ Error: This command requires administrator privileges.", err=True)
-        raise click.Abort()
+    from .database import db_manager
+    from .user_management import UserManager
 
     try:
         with db_manager.get_session() as session:
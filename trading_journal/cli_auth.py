@@ -3,18 +3,21 @@
 import os
 import sys
 import logging
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 import click
 
-from .auth import AdminModeAuth, AuthenticationManager, AuthUser
-from .authorization import AuthContext
-from .database import db_manager
+if TYPE_CHECKING:
+    from .auth import AuthUser
+
+# The auth/database stack pulls in SQLAlchemy and the ORM models, so it is
+# imported lazily when a command actually authenticates rather than when the
+# CLI module is loaded.
 
 logger = logging.getLogger(__name__)
 
 
-def authenticate_cli() -> AuthUser:
+def authenticate_cli() -> "AuthUser":
     """
     Authenticate the user for CLI operations.
 
@@ -29,6 +32,10 @@ def authenticate_cli() -> AuthUser:
     Raises:
         click.Abort: If authentication fails.
     """
+    from .auth import AdminModeAuth, AuthenticationManager
+    from .authorization import AuthContext
+    from .database import db_manager
+
     # Check for admin mode
     if AdminModeAuth.is_enabled():
         admin_user = AdminModeAuth.get_admin_user()
@@ -86,6 +93,7 @@ def require_authentication(func):
 
         finally:
             # Clean up auth context
+            from .authorization import AuthContext
             AuthContext.clear()
 
     wrapper.__name__ = func.__name__
@@ -93,6 +101,34 @@ def require_authentication(func):
     return wrapper
 
 
+def require_admin(func):
+    """
+    Decorator to require an authenticated administrator for a CLI command.
+
+    Non-admins are rejected right after authentication, before the command
+    body opens any database session of its own.
+
+    Usage:
+        @users.command()
+        @require_admin
+        def my_admin_command():
+            pass
+    """
+    @require_authentication
+    def wrapper(*args, **kwargs):
+        from .authorization import AuthContext
+
+        if not AuthContext.is_admin():
+            click.echo("❌ Error: This command requires administrator privileges.", err=True)
+            raise click.Abort()
+
+        return func(*args, **kwargs)
+
+    wrapper.__name__ = func.__name__
+    wrapper.__doc__ = func.__doc__
+    return wrapper
+
+
 def get_current_user_info() -> str:
     """
     Get a string describing the current authenticated user.
@@ -100,6 +136,8 @@ def get_current_user_info() -> str:
     Returns:
         String describing the current user, or "Not authenticated".
     """
+    from .authorization import AuthContext
+
     user = AuthContext.get_current_user()
     if not user:
         return "Not authenticated"
@@ -114,4 +152,6 @@ def warn_admin_mode_at_startup():
 
     This should be called at CLI startup (in main()).
     """
+    from .auth import AdminModeAuth
+
     AdminModeAuth.warn_if_enabled()
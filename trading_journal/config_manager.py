@@ -18,8 +18,11 @@ import os
 import sys
 import warnings
 from dataclasses import dataclass, field
+from functools import cached_property
 from pathlib import Path
-from typing import Any, Dict, Optional
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Tuple
+from urllib.parse import quote
 
 # Python 3.11+ has built-in tomllib for reading TOML
 if sys.version_info >= (3, 11):
@@ -32,9 +35,99 @@ else:
             "tomli is required for Python < 3.11. Install with: pip install tomli"
         )
 
-import tomli_w
-from dotenv import dotenv_values
+# Set once a process has loaded .env into os.environ (see wsgi.py)
+DOTENV_LOADED_ENV_VAR = "_TJ_DOTENV_LOADED"
+
+# Set to 1/true to ignore any legacy .env file without touching the filesystem
+NO_DOTENV_ENV_VAR = "TRADING_JOURNAL_NO_DOTENV"
+
+# Parsed TOML files keyed by path, tagged with the (mtime, size) they were read at.
+# Shared across ConfigManager instances so get_config_manager(reset=True)
+# only re-parses files that actually changed. Treat the dicts as read-only.
+_toml_cache: Dict[Path, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+
+# Built-in defaults, the lowest-priority config layer (read-only; merges
+# copy a section only when a higher layer changes it)
+_DEFAULT_CONFIG: Mapping[str, Mapping[str, Any]] = MappingProxyType({
+    "database": MappingProxyType({
+        "host": "localhost",
+        "port": 5432,
+        "database": "trading_journal",
+        "user": "postgres",
+        "password": None,
+    }),
+    "logging": MappingProxyType({
+        "level": "INFO",
+        "file": "~/.local/share/trading-journal/trading_journal.log",
+        "format": "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    }),
+    "app": MappingProxyType({
+        "pnl_method": "average_cost",
+        "timezone": "US/Eastern",
+        "batch_size": 1000,
+        "max_retries": 3,
+    }),
+})
+
+# Environment variable names (also used in legacy .env files) per config section
+_DB_ENV = (
+    ("host", "DB_HOST"),
+    ("port", "DB_PORT"),
+    ("database", "DB_NAME"),
+    ("user", "DB_USER"),
+    ("password", "DB_PASSWORD"),
+)
+_LOG_ENV = (
+    ("level", "LOG_LEVEL"),
+    ("file", "LOG_FILE"),
+)
+_APP_ENV = (
+    ("pnl_method", "PNL_METHOD"),
+    ("timezone", "TIMEZONE"),
+    ("batch_size", "BATCH_SIZE"),
+    ("max_retries", "MAX_RETRIES"),
+)
+_ENV_SECTIONS = (("database", _DB_ENV), ("logging", _LOG_ENV), ("app", _APP_ENV))
+
+
+def _env_layer(source: Mapping[str, Optional[str]]) -> Dict[str, Any]:
+    """Build a config layer from env-style variables, omitting unset ones."""
+    layer: Dict[str, Any] = {}
+    for section, keys in _ENV_SECTIONS:
+        values = {key: source[name] for key, name in keys if source.get(name) is not None}
+        if values:
+            layer[section] = values
+    return layer
+
+
+
+def _read_env_file(path: Path) -> Dict[str, str]:
+    """
+    Read KEY=VALUE pairs from a legacy .env file.
 
+    Handles comments, an optional "export " prefix and single/double quoted
+    values; no variable interpolation. Only a fixed set of keys is consumed,
+    so this stands in for python-dotenv on the config load path.
+    """
+    values: Dict[str, str] = {}
+    for line in path.read_text(encoding="utf-8").splitlines():
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        if line.startswith("export "):
+            line = line[len("export "):].lstrip()
+
+        key, sep, value = line.partition("=")
+        if not sep:
+            continue
+
+        value = value.strip()
+        if value[:1] in ("'", '"') and value.find(value[0], 1) > 0:
+            value = value[1:value.find(value[0], 1)]
+        else:
+            value = value.split(" #", 1)[0].rstrip()
+        values[key.strip()] = value
+    return values
 
 @dataclass
 class DatabaseConfig:
@@ -45,6 +138,11 @@ class DatabaseConfig:
     database: str = "trading_journal"
     user: str = "postgres"
     password: Optional[str] = None
+    # Connection pool sizing; pre-ping costs a round trip per checkout
+    pool_size: int = 5
+    max_overflow: int = 10
+    pool_timeout: int = 10
+    pool_pre_ping: bool = False
 
     def __post_init__(self) -> None:
         """Validate configuration after initialization."""
@@ -66,12 +164,23 @@ class DatabaseConfig:
         if not self.user:
             raise ValueError("Database user cannot be empty")
 
-    @property
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set a field and drop the cached URL so it can't go stale."""
+        super().__setattr__(name, value)
+        self.__dict__.pop("url", None)
+
+    @cached_property
     def url(self) -> str:
-        """Build database URL for SQLAlchemy."""
+        """Build database URL for SQLAlchemy (computed once per config object).
+
+        User and password are percent-encoded so characters such as '@', ':'
+        or '/' in a password don't corrupt the URL.
+        """
+        user = quote(self.user, safe="")
         if self.password:
-            return f"postgresql://{self.user}:{self.password}@{self.host}:{self.port}/{self.database}"
-        return f"postgresql://{self.user}@{self.host}:{self.port}/{self.database}"
+            password = quote(self.password, safe="")
+            return f"postgresql://{user}:{password}@{self.host}:{self.port}/{self.database}"
+        return f"postgresql://{user}@{self.host}:{self.port}/{self.database}"
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
@@ -139,6 +248,7 @@ class ConfigManager:
         # Lazy-loaded caches
         self._app_config_data: Optional[Dict[str, Any]] = None
         self._postgres_config_data: Optional[Dict[str, Any]] = None
+        self._env_file_data: Optional[Dict[str, Any]] = None
         self._merged_config: Optional[Dict[str, Any]] = None
         self._database_config: Optional[DatabaseConfig] = None
         self._logging_config: Optional[LoggingConfig] = None
@@ -155,21 +265,44 @@ class ConfigManager:
         return self._postgres_config_dir / "default.toml"
 
     def _load_toml_file(self, path: Path) -> Dict[str, Any]:
-        """Load TOML file if it exists."""
-        if not path.exists():
+        """Load TOML file if it exists, reusing the parse while the file is unchanged."""
+        try:
+            st = os.stat(path)
+        except OSError:
             return {}
 
+        stamp = (st.st_mtime_ns, st.st_size)
+        cached = _toml_cache.get(path)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+
         try:
             with open(path, "rb") as f:
-                return tomllib.load(f)
+                data = tomllib.load(f)
         except Exception as e:
             warnings.warn(f"Failed to load {path}: {e}")
             return {}
 
+        _toml_cache[path] = (stamp, data)
+        return data
+
     def _load_env_file(self) -> Dict[str, Any]:
-        """Load legacy .env file with deprecation warning."""
-        env_path = Path.cwd() / ".env"
-        if not env_path.exists():
+        """
+        Load legacy .env file with deprecation warning.
+
+        Called once per ConfigManager (_merge_section caches the result,
+        including the common "no file" case).
+        """
+        # Already loaded into os.environ, and environment variables take
+        # precedence over this layer anyway, so re-parsing it changes nothing.
+        if os.environ.get(DOTENV_LOADED_ENV_VAR):
+            return {}
+
+        if os.environ.get(NO_DOTENV_ENV_VAR, "").lower() in ("1", "true"):
+            return {}
+
+        # cwd-relative check: a single stat, no getcwd()
+        if not os.path.exists(".env"):
             return {}
 
         warnings.warn(
@@ -179,65 +312,39 @@ class ConfigManager:
             stacklevel=2,
         )
 
-        env_values = dotenv_values(env_path)
-        return {
-            "database": {
-                "host": env_values.get("DB_HOST"),
-                "port": env_values.get("DB_PORT"),
-                "database": env_values.get("DB_NAME"),
-                "user": env_values.get("DB_USER"),
-                "password": env_values.get("DB_PASSWORD"),
-            },
-            "logging": {
-                "level": env_values.get("LOG_LEVEL"),
-                "file": env_values.get("LOG_FILE"),
-            },
-            "app": {
-                "pnl_method": env_values.get("PNL_METHOD"),
-                "timezone": env_values.get("TIMEZONE"),
-                "batch_size": env_values.get("BATCH_SIZE"),
-                "max_retries": env_values.get("MAX_RETRIES"),
-            },
-        }
+        return _env_layer(_read_env_file(Path(".env")))
 
     def _load_env_vars(self) -> Dict[str, Any]:
         """Load configuration from environment variables."""
-        return {
-            "database": {
-                "host": os.getenv("DB_HOST"),
-                "port": os.getenv("DB_PORT"),
-                "database": os.getenv("DB_NAME"),
-                "user": os.getenv("DB_USER"),
-                "password": os.getenv("DB_PASSWORD"),
-            },
-            "logging": {
-                "level": os.getenv("LOG_LEVEL"),
-                "file": os.getenv("LOG_FILE"),
-            },
-            "app": {
-                "pnl_method": os.getenv("PNL_METHOD"),
-                "timezone": os.getenv("TIMEZONE"),
-                "batch_size": os.getenv("BATCH_SIZE"),
-                "max_retries": os.getenv("MAX_RETRIES"),
-            },
-        }
+        return _env_layer(os.environ)
 
     def _deep_merge(self, base: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, Any]:
         """
         Deep merge two dictionaries, with override taking precedence.
 
-        Only merges non-None values from override.
+        Only merges non-None values from override. Inputs are never mutated;
+        base is copied lazily on the first change, and returned as-is when
+        override contributes nothing (the common case for unset env layers).
+        Flat overrides (no nested dicts) are applied in a single dict merge.
         """
-        result = base.copy()
+        updates = {key: value for key, value in override.items() if value is not None}
+        if not updates:
+            return base
+        if not any(isinstance(value, dict) for value in updates.values()):
+            return {**base, **updates}
+
+        result = base
 
-        for key, value in override.items():
-            if value is None:
-                continue
+        for key, value in updates.items():
+            current = result.get(key)
+            if isinstance(current, dict) and isinstance(value, dict):
+                value = self._deep_merge(current, value)
+                if value is current:
+                    continue
 
-            if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-                result[key] = self._deep_merge(result[key], value)
-            else:
-                result[key] = value
+            if result is base:
+                result = dict(base)
+            result[key] = value
 
         return result
 
@@ -260,8 +367,13 @@ class ConfigManager:
 
         return self._app_config_data
 
-    def _get_profile_config(self) -> Dict[str, Any]:
-        """Get configuration for the current profile."""
+    def _get_profile_config(self, section: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Get configuration for the current profile.
+
+        When section is given, the referenced postgres config is only loaded
+        if that section is "database".
+        """
         app_config = self._load_app_config()
 
         # Determine active profile
@@ -276,7 +388,7 @@ class ConfigManager:
 
         # Load referenced postgres config if specified
         postgres_ref = profile_config.pop("postgres_config", None)
-        if postgres_ref:
+        if postgres_ref and section in (None, "database"):
             postgres_config = self._load_postgres_config(postgres_ref)
         else:
             postgres_config = {}
@@ -296,70 +408,62 @@ class ConfigManager:
 
         return result
 
-    def _load_merged_config(self) -> Dict[str, Any]:
+    def _merge_section(self, section: str) -> Dict[str, Any]:
         """
-        Load and merge all configuration sources according to priority.
+        Merge one config section ("database", "logging" or "app") from only
+        the sources that can set it.
 
         Priority (highest to lowest):
         1. Environment variables
         2. Profile-specific settings
-        3. App config file
-        4. Shared postgres config
+        3. App config file (app/logging only)
+        4. Shared postgres config (database only)
         5. Legacy .env file
         6. Built-in defaults
         """
         if self._merged_config is not None:
-            return self._merged_config
-
-        # Start with built-in defaults
-        config: Dict[str, Any] = {
-            "database": {
-                "host": "localhost",
-                "port": 5432,
-                "database": "trading_journal",
-                "user": "postgres",
-                "password": None,
-            },
-            "logging": {
-                "level": "INFO",
-                "file": "~/.local/share/trading-journal/trading_journal.log",
-                "format": "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-            },
-            "app": {
-                "pnl_method": "average_cost",
-                "timezone": "US/Eastern",
-                "batch_size": 1000,
-                "max_retries": 3,
-            },
-        }
+            return self._merged_config[section]
+
+        if self._env_file_data is None:
+            self._env_file_data = self._load_env_file()
 
         # Layer 5: Legacy .env file
-        config = self._deep_merge(config, self._load_env_file())
+        layers = [self._env_file_data.get(section)]
 
         # Layer 4: Shared postgres config
-        config = self._deep_merge(config, self._load_postgres_config())
+        if section == "database":
+            layers.append(self._load_postgres_config().get(section))
 
         # Layer 3: App config file (non-profile parts)
-        app_config = self._load_app_config()
-        if "app" in app_config:
-            config = self._deep_merge(config, {"app": app_config["app"]})
-        if "logging" in app_config:
-            config = self._deep_merge(config, {"logging": app_config["logging"]})
+        else:
+            layers.append(self._load_app_config().get(section))
 
         # Layer 2: Profile-specific settings
-        config = self._deep_merge(config, self._get_profile_config())
+        layers.append(self._get_profile_config(section).get(section))
 
         # Layer 1: Environment variables (highest priority)
-        config = self._deep_merge(config, self._load_env_vars())
+        layers.append(self._load_env_vars().get(section))
 
-        self._merged_config = config
-        return config
+        # Layer 6: Built-in defaults, overridden by each layer in turn
+        defaults = _DEFAULT_CONFIG[section]
+        result = defaults
+        for layer in layers:
+            if layer:
+                result = self._deep_merge(result, layer)
+        return dict(defaults) if result is defaults else result
+
+    def _load_merged_config(self) -> Dict[str, Any]:
+        """Load and merge every config section (see _merge_section for priority)."""
+        if self._merged_config is None:
+            self._merged_config = {
+                section: self._merge_section(section) for section in _DEFAULT_CONFIG
+            }
+        return self._merged_config
 
     def get_database_config(self) -> DatabaseConfig:
         """Get database configuration."""
         if self._database_config is None:
-            config = self._load_merged_config()
-            db_config = config.get("database", {})
+            db_config = self._merge_section("database")
 
             self._database_config = DatabaseConfig(
                 host=db_config.get("host", "localhost"),
@@ -367,6 +471,10 @@ class ConfigManager:
                 database=db_config.get("database", "trading_journal"),
                 user=db_config.get("user", "postgres"),
                 password=db_config.get("password"),
+                pool_size=int(db_config.get("pool_size", 5)),
+                max_overflow=int(db_config.get("max_overflow", 10)),
+                pool_timeout=int(db_config.get("pool_timeout", 10)),
+                pool_pre_ping=bool(db_config.get("pool_pre_ping", False)),
             )
 
         return self._database_config
@@ -374,8 +482,7 @@ class ConfigManager:
     def get_logging_config(self) -> LoggingConfig:
         """Get logging configuration."""
         if self._logging_config is None:
-            config = self._load_merged_config()
-            log_config = config.get("logging", {})
+            log_config = self._merge_section("logging")
 
             self._logging_config = LoggingConfig(
                 level=log_config.get("level", "INFO"),
@@ -392,8 +499,7 @@ class ConfigManager:
     def get_application_config(self) -> ApplicationConfig:
         """Get application configuration."""
         if self._application_config is None:
-            config = self._load_merged_config()
-            app_config = config.get("app", {})
+            app_config = self._merge_section("app")
 
             self._application_config = ApplicationConfig(
                 pnl_method=app_config.get("pnl_method", "average_cost"),
@@ -3,19 +3,28 @@
 import logging
 from datetime import datetime, date, timedelta
 import re
-from typing import Optional, Dict, Any, List, Tuple
+from typing import Optional, Dict, Any, Iterable, Iterator, List, Tuple
 from decimal import Decimal
+from itertools import accumulate
 
-from sqlalchemy import and_, func, case
+from sqlalchemy import and_, func, or_
 from sqlalchemy.orm import Session
 
 from .database import db_manager
-from .models import CompletedTrade, Position
+from .models import CompletedTrade, Position, SetupPattern, TradeAnnotation
 from .authorization import AuthContext
 
 logger = logging.getLogger(__name__)
 
 
+def _parse_day(value: str) -> date:
+    """Parse a YYYY-MM-DD string; zero-padded input takes the C fromisoformat path."""
+    if len(value) == 10 and value[4] == '-' and value[7] == '-':
+        return date.fromisoformat(value)
+    # Unpadded forms such as 2024-1-5 are still accepted, as before
+    return datetime.strptime(value, '%Y-%m-%d').date()
+
+
 class DashboardEngine:
     """Generates comprehensive dashboard metrics and analytics."""
 
@@ -32,6 +41,11 @@ class DashboardEngine:
         """
         Generate complete dashboard metrics.
 
+        Per-pattern totals and the running equity curve are computed by
+        PostgreSQL; the ordered per-trade rows are streamed once through the
+        core metrics/streaks pass, which also records the equity curve that
+        the drawdown walk reads.
+
         Args:
             start_date: Optional start date for filtering
             end_date: Optional end date for filtering
@@ -40,30 +54,32 @@ class DashboardEngine:
         Returns:
             Dictionary with all dashboard metrics
         """
-        user_id = AuthContext.require_user().user_id
+        user_id = AuthContext.require_user_id()
+
+        # Build the shared filter set for completed trades
+        filters = [CompletedTrade.user_id == user_id]
+
+        # Apply date filters
+        if start_date:
+            filters.append(CompletedTrade.closed_at >= start_date)
+        if end_date:
+            # Include the entire end date: everything before the next midnight
+            filters.append(CompletedTrade.closed_at < end_date + timedelta(days=1))
+        if symbol:
+            filters.append(CompletedTrade.symbol == symbol)
+        if account_id is not None:
+            filters.append(CompletedTrade.account_id == account_id)
 
         with self.db_manager.get_session() as session:
-            # Build base query for completed trades
-            query = session.query(CompletedTrade).filter(
-                CompletedTrade.user_id == user_id
+            # Stream the ordered rows once: each row is recorded as an equity
+            # curve point as it passes through the core metrics/streaks pass
+            equity_curve: List[Dict[str, Any]] = []
+            trades = self._query_equity_rows(session, filters)
+            core_metrics = self._calculate_core_metrics(
+                self._record_equity_curve(trades, equity_curve)
             )
 
-            # Apply date filters
-            if start_date:
-                query = query.filter(CompletedTrade.closed_at >= start_date)
-            if end_date:
-                # Include the entire end date (through end of day)
-                query = query.filter(CompletedTrade.closed_at < datetime.combine(
-                    end_date, datetime.max.time()
-                ))
-            if symbol:
-                query = query.filter(CompletedTrade.symbol == symbol)
-            if account_id is not None:
-                query = query.filter(CompletedTrade.account_id == account_id)
-
-            trades = query.order_by(CompletedTrade.closed_at).all()
-
-            if not trades:
+            if not equity_curve:
                 return {
                     "period": {
                         "start_date": start_date.isoformat() if start_date else None,
@@ -73,10 +89,8 @@ class DashboardEngine:
                     "message": "No completed trades found for the specified period"
                 }
 
-            # Calculate all metrics
-            core_metrics = self._calculate_core_metrics(trades)
-            pattern_metrics = self._calculate_pattern_metrics(trades)
-            equity_curve = self._calculate_equity_curve(trades)
+            # Calculate remaining metrics
+            pattern_metrics = self._calculate_pattern_metrics(session, filters)
             max_drawdown = self._calculate_max_drawdown(equity_curve)
             position_summary = self._get_position_summary(session, user_id)
 
@@ -85,8 +99,8 @@ class DashboardEngine:
                     "start_date": start_date.isoformat() if start_date else None,
                     "end_date": end_date.isoformat() if end_date else None,
                     "symbol": symbol,
-                    "first_trade": trades[0].closed_at.isoformat() if trades else None,
-                    "last_trade": trades[-1].closed_at.isoformat() if trades else None
+                    "first_trade": equity_curve[0]["timestamp"],
+                    "last_trade": equity_curve[-1]["timestamp"]
                 },
                 "core_metrics": core_metrics,
                 "pattern_analysis": pattern_metrics,
@@ -95,22 +109,67 @@ class DashboardEngine:
                 "positions": position_summary
             }
 
-    def _calculate_core_metrics(self, trades: List[CompletedTrade]) -> Dict[str, Any]:
-        """Calculate core performance metrics."""
-        if not trades:
-            return {}
-
-        total_trades = len(trades)
-        winning_trades = [t for t in trades if t.is_winning_trade]
-        losing_trades = [t for t in trades if not t.is_winning_trade]
+    def _query_equity_rows(self, session: Session, filters: List[Any]) -> Iterator[Any]:
+        """
+        Fetch trades in close order with the running P&L computed by a window function.
 
-        winning_count = len(winning_trades)
-        losing_count = len(losing_trades)
+        Rows are (completed_trade_id, symbol, closed_at, net_pnl,
+        is_winning_trade, cumulative_pnl); the metric helpers unpack them
+        positionally rather than through Row attribute lookups. Rows are
+        streamed in batches rather than materialized as a list.
+        """
+        order = (CompletedTrade.closed_at, CompletedTrade.completed_trade_id)
+        return session.query(
+            CompletedTrade.completed_trade_id,
+            CompletedTrade.symbol,
+            CompletedTrade.closed_at,
+            CompletedTrade.net_pnl,
+            CompletedTrade.is_winning_trade,
+            func.sum(func.coalesce(CompletedTrade.net_pnl, 0)).over(
+                order_by=order, rows=(None, 0)
+            ).label("cumulative_pnl"),
+        ).filter(*filters).order_by(*order).yield_per(1000)
+
+    def _calculate_core_metrics(self, trades: Iterable[Any]) -> Dict[str, Any]:
+        """Calculate core performance metrics and streaks in one pass over the trades."""
+        total_trades = 0
+        winning_count = 0
+        total_pnl = winning_pnl = losing_pnl = Decimal('0')
+        largest_win: Optional[Decimal] = None
+        largest_loss: Optional[Decimal] = None
+        max_win_streak = max_loss_streak = 0
+        current_win_streak = current_loss_streak = 0
+
+        # Rows come from _query_equity_rows; unpack positionally
+        for _, _, _, pnl, is_win, _ in trades:
+            total_trades += 1
+            if is_win:
+                winning_count += 1
+                current_win_streak += 1
+                current_loss_streak = 0
+                if current_win_streak > max_win_streak:
+                    max_win_streak = current_win_streak
+                if pnl is not None:
+                    winning_pnl += pnl
+            else:
+                current_loss_streak += 1
+                current_win_streak = 0
+                if current_loss_streak > max_loss_streak:
+                    max_loss_streak = current_loss_streak
+                if pnl is not None:
+                    losing_pnl += pnl
+
+            if pnl:
+                total_pnl += pnl
+                if largest_win is None or pnl > largest_win:
+                    largest_win = pnl
+                if largest_loss is None or pnl < largest_loss:
+                    largest_loss = pnl
+
+        if not total_trades:
+            return {}
 
-        # Calculate P&L
-        total_pnl = sum(t.net_pnl for t in trades if t.net_pnl)
-        winning_pnl = sum(t.net_pnl for t in winning_trades if t.net_pnl)
-        losing_pnl = sum(t.net_pnl for t in losing_trades if t.net_pnl)
+        losing_count = total_trades - winning_count
 
         # Calculate averages
         avg_win = winning_pnl / winning_count if winning_count > 0 else Decimal('0')
@@ -125,12 +184,9 @@ class DashboardEngine:
         # Average trade
         avg_trade = total_pnl / total_trades if total_trades > 0 else Decimal('0')
 
-        # Largest win/loss
-        largest_win = max((t.net_pnl for t in trades if t.net_pnl), default=Decimal('0'))
-        largest_loss = min((t.net_pnl for t in trades if t.net_pnl), default=Decimal('0'))
-
-        # Calculate consecutive streaks
-        max_win_streak, max_loss_streak = self._calculate_streaks(trades)
+        # Largest win/loss (zero-P&L trades don't count)
+        largest_win = largest_win if largest_win is not None else Decimal('0')
+        largest_loss = largest_loss if largest_loss is not None else Decimal('0')
 
         return {
             "total_trades": total_trades,
@@ -150,77 +206,79 @@ class DashboardEngine:
             "max_loss_streak": max_loss_streak
         }
 
-    def _calculate_pattern_metrics(self, trades: List[CompletedTrade]) -> Dict[str, Any]:
-        """Calculate metrics by setup pattern."""
-        pattern_stats = {}
-
-        # Group trades by pattern
-        for trade in trades:
-            ann = trade.trade_annotation
-            pattern = (ann.setup_pattern_rel.pattern_name if ann and ann.setup_pattern_rel else None) or "No Pattern"
-
-            if pattern not in pattern_stats:
-                pattern_stats[pattern] = {
-                    "trades": [],
-                    "total_pnl": Decimal('0'),
-                    "winning_count": 0,
-                    "losing_count": 0
-                }
-
-            stats = pattern_stats[pattern]
-            stats["trades"].append(trade)
-            stats["total_pnl"] += trade.net_pnl if trade.net_pnl else Decimal('0')
-
-            if trade.is_winning_trade:
-                stats["winning_count"] += 1
-            else:
-                stats["losing_count"] += 1
+    def _calculate_pattern_metrics(self, session: Session, filters: List[Any]) -> Dict[str, Any]:
+        """Calculate metrics by setup pattern with a single GROUP BY query."""
+        pattern = func.coalesce(
+            func.nullif(SetupPattern.pattern_name, ''), 'No Pattern'
+        ).label("pattern")
+        is_win = CompletedTrade.is_winning_trade.is_(True)
+        total_pnl = func.coalesce(func.sum(CompletedTrade.net_pnl), 0).label("total_pnl")
+        # Sort by total P&L (best performing first)
+        rows = session.query(
+            pattern,
+            func.count().label("total_trades"),
+            func.count().filter(is_win).label("winning_count"),
+            total_pnl,
+        ).select_from(CompletedTrade).outerjoin(
+            TradeAnnotation,
+            TradeAnnotation.completed_trade_id == CompletedTrade.completed_trade_id
+        ).outerjoin(
+            SetupPattern,
+            SetupPattern.pattern_id == TradeAnnotation.setup_pattern_id
+        ).filter(*filters).group_by(pattern).order_by(total_pnl.desc()).all()
 
         # Calculate metrics for each pattern
         pattern_results = []
-        for pattern, stats in pattern_stats.items():
-            total_trades = len(stats["trades"])
-            win_rate = (stats["winning_count"] / total_trades * 100) if total_trades > 0 else 0
+        for row in rows:
+            total_trades = row.total_trades
+            win_rate = (row.winning_count / total_trades * 100) if total_trades > 0 else 0
+            total_pnl = Decimal(row.total_pnl)
 
             pattern_results.append({
-                "pattern": pattern,
+                "pattern": row.pattern,
                 "total_trades": total_trades,
-                "winning_trades": stats["winning_count"],
-                "losing_trades": stats["losing_count"],
+                "winning_trades": row.winning_count,
+                "losing_trades": total_trades - row.winning_count,
                 "win_rate_pct": float(win_rate),
-                "total_pnl": float(stats["total_pnl"]),
-                "avg_pnl": float(stats["total_pnl"] / total_trades) if total_trades > 0 else 0.0
+                "total_pnl": float(total_pnl),
+                "avg_pnl": float(total_pnl / total_trades) if total_trades > 0 else 0.0
             })
 
-        # Sort by total P&L (best performing first)
-        pattern_results.sort(key=lambda x: x["total_pnl"], reverse=True)
-
         return {
             "by_pattern": pattern_results,
             "top_pattern": pattern_results[0] if pattern_results else None,
             "worst_pattern": pattern_results[-1] if pattern_results else None
         }
 
-    def _calculate_equity_curve(self, trades: List[CompletedTrade]) -> List[Dict[str, Any]]:
-        """Calculate equity curve showing cumulative P&L over time."""
-        curve = []
-        cumulative_pnl = Decimal('0')
-
-        for trade in trades:
-            cumulative_pnl += trade.net_pnl if trade.net_pnl else Decimal('0')
-            curve.append({
-                "timestamp": trade.closed_at.isoformat() if trade.closed_at else None,
-                "trade_id": trade.completed_trade_id,
-                "symbol": trade.symbol,
-                "trade_pnl": float(trade.net_pnl) if trade.net_pnl else 0.0,
+    def _record_equity_curve(
+        self, trades: Iterable[Any], equity_curve: List[Dict[str, Any]]
+    ) -> Iterator[Any]:
+        """Pass rows through unchanged, appending each one's equity curve point.
+
+        Points carry the SQL running total, so building the curve needs no
+        state of its own and can ride along with another pass over a stream.
+        """
+        for row in trades:
+            trade_id, symbol, closed_at, pnl, _, cumulative_pnl = row
+            equity_curve.append({
+                "timestamp": closed_at.isoformat() if closed_at else None,
+                "trade_id": trade_id,
+                "symbol": symbol,
+                "trade_pnl": float(pnl) if pnl else 0.0,
                 "cumulative_pnl": float(cumulative_pnl)
             })
-
-        return curve
+            yield row
 
     def _calculate_max_drawdown(self, equity_curve: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Calculate maximum drawdown from equity curve."""
-        if not equity_curve:
+        # Running peak via accumulate (peak starts at break-even), then the
+        # drawdown at each point; only points below a positive peak count.
+        values = [point["cumulative_pnl"] for point in equity_curve]
+        peaks = list(accumulate(values, max, initial=0.0))[1:]
+        drawdowns = [peak - value if peak > 0 else 0.0 for peak, value in zip(peaks, values)]
+        trough = max(range(len(drawdowns)), key=drawdowns.__getitem__, default=None)
+
+        if trough is None or drawdowns[trough] <= 0:
             return {
                 "max_drawdown": 0.0,
                 "max_drawdown_pct": 0.0,
@@ -230,97 +288,38 @@ class DashboardEngine:
                 "trough_date": None
             }
 
-        max_drawdown = 0.0
-        max_drawdown_pct = 0.0
-        peak_value = 0.0
-        trough_value = 0.0
-        peak_date = None
-        trough_date = None
-
-        current_peak = 0.0
-        current_peak_date = None
-
-        for point in equity_curve:
-            value = point["cumulative_pnl"]
-
-            # Update peak
-            if value > current_peak:
-                current_peak = value
-                current_peak_date = point["timestamp"]
-
-            # Calculate drawdown from current peak
-            if current_peak > 0:
-                drawdown = current_peak - value
-                drawdown_pct = (drawdown / current_peak) * 100
-
-                if drawdown > max_drawdown:
-                    max_drawdown = drawdown
-                    max_drawdown_pct = drawdown_pct
-                    peak_value = current_peak
-                    trough_value = value
-                    peak_date = current_peak_date
-                    trough_date = point["timestamp"]
-
+        peak_value = peaks[trough]
+        max_drawdown = drawdowns[trough]
         return {
             "max_drawdown": float(max_drawdown),
-            "max_drawdown_pct": float(max_drawdown_pct),
+            "max_drawdown_pct": float(max_drawdown / peak_value * 100),
             "peak_value": float(peak_value),
-            "trough_value": float(trough_value),
-            "peak_date": peak_date,
-            "trough_date": trough_date
+            "trough_value": float(values[trough]),
+            # The peak was set by the first point to reach it
+            "peak_date": equity_curve[values.index(peak_value)]["timestamp"],
+            "trough_date": equity_curve[trough]["timestamp"]
         }
 
-    def _calculate_streaks(self, trades: List[CompletedTrade]) -> Tuple[int, int]:
-        """Calculate maximum consecutive winning and losing streaks."""
-        max_win_streak = 0
-        max_loss_streak = 0
-        current_win_streak = 0
-        current_loss_streak = 0
-
-        for trade in trades:
-            if trade.is_winning_trade:
-                current_win_streak += 1
-                current_loss_streak = 0
-                max_win_streak = max(max_win_streak, current_win_streak)
-            else:
-                current_loss_streak += 1
-                current_win_streak = 0
-                max_loss_streak = max(max_loss_streak, current_loss_streak)
-
-        return max_win_streak, max_loss_streak
-
     def _get_position_summary(self, session: Session, user_id: int) -> Dict[str, Any]:
-        """Get summary of current positions."""
-        open_positions = session.query(Position).filter(
-            and_(
-                Position.user_id == user_id,
-                Position.closed_at.is_(None),
-                Position.current_qty != 0
-            )
-        ).all()
-
-        closed_positions = session.query(Position).filter(
-            and_(
-                Position.user_id == user_id,
-                Position.closed_at.isnot(None)
-            )
-        ).all()
-
-        total_open_value = sum(
-            abs(p.current_qty * p.avg_cost_basis) for p in open_positions
-            if p.avg_cost_basis
-        )
-
-        total_realized_pnl = sum(
-            p.realized_pnl for p in (open_positions + closed_positions)
-            if p.realized_pnl
-        )
+        """Get summary of current positions with a single aggregate query."""
+        is_open = and_(Position.closed_at.is_(None), Position.current_qty != 0)
+        is_closed = Position.closed_at.isnot(None)
+        totals = session.query(
+            func.count().filter(is_open).label("open_positions"),
+            func.count().filter(is_closed).label("closed_positions"),
+            func.coalesce(
+                func.sum(func.abs(Position.current_qty * Position.avg_cost_basis)).filter(is_open), 0
+            ).label("total_open_value"),
+            func.coalesce(
+                func.sum(Position.realized_pnl).filter(or_(is_open, is_closed)), 0
+            ).label("total_realized_pnl"),
+        ).filter(Position.user_id == user_id).one()
 
         return {
-            "open_positions": len(open_positions),
-            "closed_positions": len(closed_positions),
-            "total_open_value": float(total_open_value),
-            "total_realized_pnl": float(total_realized_pnl)
+            "open_positions": totals.open_positions,
+            "closed_positions": totals.closed_positions,
+            "total_open_value": float(totals.total_open_value),
+            "total_realized_pnl": float(totals.total_realized_pnl)
         }
 
     def parse_date_range(self, date_range_str: Optional[str]) -> Tuple[Optional[date], Optional[date]]:
@@ -363,13 +362,13 @@ class DashboardEngine:
 
             if start_str:
                 try:
-                    start_date = datetime.strptime(start_str, '%Y-%m-%d').date()
+                    start_date = _parse_day(start_str)
                 except ValueError:
                     raise ValueError(f"Invalid start date '{start_str}'. Expected format: YYYY-MM-DD")
 
             if end_str:
                 try:
-                    end_date = datetime.strptime(end_str, '%Y-%m-%d').date()
+                    end_date = _parse_day(end_str)
                 except ValueError:
                     raise ValueError(f"Invalid end date '{end_str}'. Expected format: YYYY-MM-DD")
             else:
@@ -379,7 +378,7 @@ class DashboardEngine:
 
         # Bare date (no slash) — treat as single day (start == end)
         try:
-            single = datetime.strptime(s, '%Y-%m-%d').date()
+            single = _parse_day(s)
             return single, single
         except ValueError:
             pass
@@ -1,11 +1,13 @@
 """Database engine and session management."""
 
 import logging
+import os
 from contextlib import contextmanager
-from typing import Generator, Optional
+from typing import Any, Dict, Generator, Optional
 
-from sqlalchemy import create_engine, Engine, text
-from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy import create_engine, event, Engine, QueuePool, text
+from sqlalchemy.engine import make_url
+from sqlalchemy.orm import raiseload, sessionmaker, ORMExecuteState, Session
 
 from .config import db_config, DatabaseConfig
 from .models import Base
@@ -13,6 +15,41 @@ from .models import Base
 logger = logging.getLogger(__name__)
 
 
+def _executemany_options(url: str) -> Dict[str, Any]:
+    """Driver-specific executemany tuning for create_engine.
+
+    INSERT executemany is already folded into multi-row VALUES pages by
+    insertmanyvalues; under psycopg2, values_plus_batch also sends UPDATE and
+    DELETE executemany (e.g. ORM flushes of many dirty rows) through
+    execute_batch. Other drivers don't accept these options.
+    """
+    if make_url(url).get_driver_name() != "psycopg2":
+        return {}
+    return {"executemany_mode": "values_plus_batch", "executemany_batch_page_size": 500}
+
+
+def _strict_loads_enabled() -> bool:
+    """Whether TRADING_JOURNAL_STRICT_LOADS asks for lazy loads to raise."""
+    return os.getenv("TRADING_JOURNAL_STRICT_LOADS", "false").lower() in ("1", "true")
+
+
+def _raise_on_lazy_sql(orm_execute_state: ORMExecuteState) -> None:
+    """Make every relationship on top-level ORM selects raise instead of lazy-loading.
+
+    Only relationships that would emit SQL raise (identity-map hits are still
+    fine), and explicit joinedload/selectinload options at the call site win
+    over the wildcard, so the fix for a reported N+1 is to eager-load there.
+    """
+    if (
+        orm_execute_state.is_select
+        and not orm_execute_state.is_column_load
+        and not orm_execute_state.is_relationship_load
+    ):
+        orm_execute_state.statement = orm_execute_state.statement.options(
+            raiseload("*", sql_only=True)
+        )
+
+
 class DatabaseManager:
     """Manages database connections and sessions."""
 
@@ -28,14 +65,29 @@ class DatabaseManager:
             config = db_config._get_config()  # type: ignore
 
         self._config = config
+        # Connections are opened lazily and kept for reuse, so the CLI and each
+        # gunicorn sync worker normally hold a single connection across
+        # get_session() calls. Pre-ping is off by default (it adds a SELECT 1
+        # round trip per checkout); pool_recycle retires idle connections and
+        # a disconnect error invalidates the pool so the next session reconnects.
         self._engine: Engine = create_engine(
             config.url,
             echo=False,  # Set to True for SQL debugging
-            pool_pre_ping=True,
-            pool_recycle=3600,
+            poolclass=QueuePool,
+            pool_size=config.pool_size,
+            max_overflow=config.max_overflow,
+            pool_timeout=config.pool_timeout,
+            pool_pre_ping=config.pool_pre_ping,
+            pool_recycle=300,
+            insertmanyvalues_page_size=1000,
+            **_executemany_options(config.url),
         )
         self._session_factory = sessionmaker(bind=self._engine, expire_on_commit=False)
 
+        # Development/CI guard: turn silent N+1 lazy loads into hard errors
+        if _strict_loads_enabled():
+            event.listen(self._session_factory, "do_orm_execute", _raise_on_lazy_sql)
+
     @property
     def engine(self) -> Engine:
         """Get database engine."""
@@ -115,7 +167,12 @@ class _DBManagerProxy:
 
     def __getattr__(self, name: str):
         """Proxy all attribute access to the global DatabaseManager."""
-        return getattr(get_db_manager(), name)
+        # Read the singleton directly once it exists; it can't be bound for
+        # good, since get_db_manager(reset=True) swaps it (tests do)
+        manager = _db_manager
+        if manager is None:
+            manager = get_db_manager()
+        return getattr(manager, name)
 
 
 db_manager = _DBManagerProxy()  # type: ignore
\ No newline at end of file
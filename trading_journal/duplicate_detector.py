@@ -3,7 +3,8 @@
 import logging
 from typing import List, Dict, Any, Set
 from pathlib import Path
-from sqlalchemy import select
+from sqlalchemy import Select, String, bindparam, func, select
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.orm import Session
 
 from .models import Trade, User
@@ -16,6 +17,8 @@ logger = logging.getLogger(__name__)
 class DuplicateDetectionResult:
     """Results from duplicate detection check."""
 
+    __slots__ = ('has_duplicates', 'duplicate_count', 'duplicates_by_user', 'duplicate_unique_keys')
+
     def __init__(self):
         self.has_duplicates: bool = False
         self.duplicate_count: int = 0
@@ -36,20 +39,70 @@ class DuplicateDetectionResult:
         self.duplicates_by_user[user_id]['unique_keys'].append(unique_key)
 
 
+def _existing_trades_query() -> Select:
+    """
+    Select (unique_key, user_id, username) for stored trades matching :unique_keys.
+
+    The keys travel as one text[] parameter expanded server-side with
+    unnest() and joined, rather than as a bind parameter per key, so the
+    statement text is the same for every file and PostgreSQL can hash-join
+    large uploads.
+    """
+    candidate_keys = func.unnest(
+        bindparam("unique_keys", type_=ARRAY(String))
+    ).table_valued("unique_key").render_derived(name="candidate_keys")
+
+    return select(
+        Trade.unique_key,
+        Trade.user_id,
+        User.username
+    ).join(
+        User, Trade.user_id == User.user_id
+    ).join(
+        candidate_keys, candidate_keys.c.unique_key == Trade.unique_key
+    )
+
+
 class DuplicateDetector:
     """Handles duplicate detection across users and per-user."""
 
     def __init__(self, session: Session = None):
+        """
+        Use the given session, or open one from db_manager.
+
+        A detector that opens its own session must be closed, either with
+        close() or by using it as a context manager.
+        """
         self.session = session
-        self._should_close_session = False
+        self._session_cm = None
 
         if self.session is None:
-            self.session = db_manager.get_session().__enter__()
-            self._should_close_session = True
+            self._session_cm = db_manager.get_session()
+            self.session = self._session_cm.__enter__()
+
+    def __enter__(self) -> "DuplicateDetector":
+        return self
 
-    def __del__(self):
-        if self._should_close_session and self.session:
-            self.session.close()
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self._release_session(exc_type, exc, tb)
+
+    def close(self) -> None:
+        """Commit and close the session this detector opened, if any."""
+        self._release_session(None, None, None)
+
+    def _release_session(self, exc_type, exc, tb) -> None:
+        session_cm, self._session_cm = self._session_cm, None
+        if session_cm is not None:
+            session_cm.__exit__(exc_type, exc, tb)
+
+    # Built once; the keys (and user_id) are bound at execute time
+    _EXISTING_TRADES = _existing_trades_query()
+    _EXISTING_USER_TRADES = _EXISTING_TRADES.where(Trade.user_id == bindparam("user_id"))
+
+    @staticmethod
+    def _key_params(records: List[NdjsonRecord]) -> Dict[str, Any]:
+        """Bind the records' keys, each once so each stored trade is reported once (as with IN)."""
+        return {"unique_keys": list(dict.fromkeys(record.unique_key for record in records))}
 
     def check_duplicates_cross_user(
         self,
@@ -71,22 +124,15 @@ class DuplicateDetector:
         if not records:
             return result
 
-        # Extract unique keys from records
-        unique_keys = [record.unique_key for record in records]
-
-        # Query database for existing trades with these keys (ANY user)
-        stmt = select(
-            Trade.unique_key,
-            Trade.user_id,
-            User.username
-        ).join(
-            User, Trade.user_id == User.user_id
-        ).where(
-            Trade.unique_key.in_(unique_keys)
+        # Query database for existing trades with these keys (ANY user).
+        # Re-uploads can match every key in a large file: stream the rows in
+        # batches through a server-side cursor instead of fetching them all
+        existing_trades = self.session.execute(
+            self._EXISTING_TRADES,
+            self._key_params(records),
+            execution_options={"yield_per": 1000},
         )
 
-        existing_trades = self.session.execute(stmt).all()
-
         # Group duplicates by user
         for unique_key, user_id, username in existing_trades:
             result.add_duplicate(user_id, username, unique_key)
@@ -113,22 +159,11 @@ class DuplicateDetector:
         if not records:
             return result
 
-        # Extract unique keys
-        unique_keys = [record.unique_key for record in records]
-
         # Query for this user only
-        stmt = select(
-            Trade.unique_key,
-            Trade.user_id,
-            User.username
-        ).join(
-            User, Trade.user_id == User.user_id
-        ).where(
-            Trade.user_id == user_id,
-            Trade.unique_key.in_(unique_keys)
-        )
-
-        existing_trades = self.session.execute(stmt).all()
+        existing_trades = self.session.execute(
+            self._EXISTING_USER_TRADES,
+            {**self._key_params(records), "user_id": user_id},
+        ).all()
 
         for unique_key, user_id, username in existing_trades:
             result.add_duplicate(user_id, username, unique_key)
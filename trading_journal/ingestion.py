@@ -1,15 +1,22 @@
 """NDJSON data ingestion and processing."""
 
+import csv
+import io
 import json
 import logging
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from contextlib import nullcontext
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Tuple, Union
 
 import click
-from pydantic import ValidationError
-from sqlalchemy import text
+from pydantic import TypeAdapter, ValidationError
+from sqlalchemy import Boolean, func, literal_column, select, text
 from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.sql import column as column_clause, table as table_clause
 from sqlalchemy.orm import Session  # noqa: F401 (used in type hint)
 
 from .database import db_manager
@@ -20,9 +27,55 @@ from .authorization import AuthContext
 from .duplicate_detector import DuplicateDetector
 from .observability import UploadPerfLogger
 
+# orjson, when installed, parses NDJSON lines several times faster than json.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_loads(line: Union[str, bytes]) -> Any:
+    """Parse one JSON document, preferring orjson when it is available.
+
+    Lines orjson rejects (e.g. NaN literals, which json accepts) fall back
+    to json.loads, so accepted input and JSONDecodeError reporting match json.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(line)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(line)
+
 logger = logging.getLogger(__name__)
 
 
+def _trade_upsert(*update_columns: str):
+    """INSERT INTO trades ... ON CONFLICT (user_id, unique_key) DO UPDATE the given columns."""
+    stmt = insert(Trade)
+    return stmt.on_conflict_do_update(
+        index_elements=['user_id', 'unique_key'],
+        set_={column: stmt.excluded[column] for column in update_columns}
+    )
+
+
+# Ingestion statements are built once; rows are bound at execute time.
+# Classification (spread_order_tag/spread_type) is re-derived on every ingest so
+# a parser fix (or a corrected re-upload) can heal previously-wrong values (issue #23)
+_UPSERT_RETURNING_STMT = _trade_upsert(
+    'exec_timestamp',
+    'qty',  # Important: update qty to handle signed->unsigned conversion
+    'net_price', 'realized_pnl',
+    'spread_order_tag', 'spread_type', 'processing_timestamp',
+).returning(Trade.trade_id)
+
+# xmax is 0 only on a row the statement inserted (not one it updated)
+_TRACKED_UPSERT_STMT = _trade_upsert(
+    'exec_timestamp', 'net_price', 'realized_pnl', 'account_id',
+    'spread_order_tag', 'spread_type', 'processing_timestamp',
+).returning(literal_column("xmax = 0", Boolean).label("inserted"))
+
+
 class IngestionError(Exception):
     """Custom exception for ingestion errors."""
     pass
@@ -31,6 +84,12 @@ class IngestionError(Exception):
 class NdjsonIngester:
     """Handles NDJSON file ingestion and processing."""
 
+    # Validates a whole chunk of rows in one call into pydantic-core
+    _records_adapter = TypeAdapter(List[NdjsonRecord])
+    VALIDATION_CHUNK_SIZE = 1000
+    # Uploads this large go through COPY into a staging table
+    COPY_THRESHOLD = 1024
+
     def __init__(self):
         self.db_manager = db_manager
         self.position_tracker = PositionTracker()
@@ -41,12 +100,17 @@ class NdjsonIngester:
         dry_run: bool = False,
         verbose: bool = False,
         skip_duplicate_check: bool = False,
-        force: bool = False
+        force: bool = False,
+        parsed: Optional["Future[Tuple[List[NdjsonRecord], List[str]]]"] = None
     ) -> Dict[str, Any]:
-        """Process a single NDJSON file with duplicate detection."""
+        """Process a single NDJSON file with duplicate detection.
+
+        ``parsed`` lets process_batch hand over the file's (records, errors)
+        already read and validated in a worker process.
+        """
 
         logger.info(f"Processing file: {file_path}")
-        user_id = AuthContext.require_user().user_id
+        user_id = AuthContext.require_user_id()
 
         # Start processing log
         processing_log = ProcessingLog(
@@ -56,53 +120,25 @@ class NdjsonIngester:
             status="processing"
         )
 
-        records_processed = 0
-        records_failed = 0
-        validation_errors = []
-        successful_records = []
-
         try:
-            # Read and validate NDJSON records
-            records = self._read_ndjson_file(file_path)
-
-            if verbose:
-                logger.info(f"Read {len(records)} records from file")
-
-            for record_data in records:
-                try:
-                    # Validate record schema
-                    record = NdjsonRecord(**record_data)
-
-                    # Skip section headers
-                    if record.is_section_header:
-                        if verbose:
-                            logger.debug(f"Skipping section header: {record.section}")
-                        continue
-
-                    # Only process fill records for now
-                    if not record.is_fill:
-                        if verbose:
-                            logger.debug(f"Skipping non-fill record: {record.event_type}")
-                        continue
-
-                    successful_records.append(record)
-                    records_processed += 1
-
-                except ValidationError as e:
-                    records_failed += 1
-                    error_msg = f"Row {record_data.get('row_index', 'unknown')}: {str(e)}"
-                    validation_errors.append(error_msg)
-                    logger.warning(f"Validation error: {error_msg}")
+            if parsed is not None:
+                successful_records, validation_errors = parsed.result()
+            else:
+                # Stream NDJSON records straight into validation
+                records = self._read_ndjson_file(file_path)
+                successful_records, validation_errors = self._validate_records(records, verbose)
+            records_processed = len(successful_records)
+            records_failed = len(validation_errors)
 
             # Duplicate detection (before processing)
             if not skip_duplicate_check and successful_records:
-                detector = DuplicateDetector()
-
-                # Check for cross-user duplicates
-                cross_user_dupes = detector.check_duplicates_cross_user(
-                    successful_records,
-                    user_id
-                )
+                # Check for cross-user duplicates; the detector's session is
+                # released before any confirmation prompt below
+                with DuplicateDetector() as detector:
+                    cross_user_dupes = detector.check_duplicates_cross_user(
+                        successful_records,
+                        user_id
+                    )
 
                 if cross_user_dupes.has_duplicates:
                     report = detector.format_duplicate_report(cross_user_dupes, user_id)
@@ -129,7 +165,13 @@ class NdjsonIngester:
                     else:
                         logger.info(f"DRY RUN: {report}")
 
-            # Process records to database with insert/update tracking
+            # Update processing log
+            processing_log.records_processed = records_processed
+            processing_log.records_failed = records_failed
+            processing_log.status = "completed" if records_failed == 0 else "partial"
+
+            # Process records to database with insert/update tracking; the
+            # processing log is committed in the same transaction
             insert_count = 0
             update_count = 0
 
@@ -137,18 +179,13 @@ class NdjsonIngester:
                 insert_count, update_count = self._insert_records_with_tracking(
                     user_id,
                     successful_records,
-                    str(file_path)
+                    str(file_path),
+                    processing_log
                 )
-                # Position tracking handled within _insert_records_with_tracking
-
-            # Update processing log
-            processing_log.processing_completed_at = datetime.now()
-            processing_log.records_processed = records_processed
-            processing_log.records_failed = records_failed
-            processing_log.status = "completed" if records_failed == 0 else "partial"
-
-            if not dry_run:
-                self._save_processing_log(processing_log)
+            else:
+                processing_log.processing_completed_at = datetime.now()
+                if not dry_run:
+                    self._save_processing_log(processing_log)
 
             result = {
                 "file_path": str(file_path),
@@ -178,68 +215,226 @@ class NdjsonIngester:
 
             raise IngestionError(f"File processing failed: {e}") from e
 
-    def _read_ndjson_file(self, file_path: Path) -> List[Dict[str, Any]]:
-        """Read and parse NDJSON file."""
-        records = []
+    def _validate_records(
+        self, records: Iterable[Dict[str, Any]], verbose: bool = False
+    ) -> Tuple[List[NdjsonRecord], List[str]]:
+        """Validate raw record dicts, returning (fill records, validation errors).
 
+        Section headers and non-fill event types are dropped before pydantic
+        sees them, so only rows that will actually be inserted pay for model
+        validation (and they don't generate spurious validation errors).
+        Rows are validated in chunks; a chunk with a bad row is re-validated
+        row by row so each error still names its row.
+        """
+        successful_records: List[NdjsonRecord] = []
+        validation_errors: List[str] = []
+        chunk: List[Dict[str, Any]] = []
+        records_read = 0
+
+        for record_data in records:
+            records_read += 1
+            if not isinstance(record_data, dict):
+                error_msg = f"Record {records_read}: expected a JSON object, got {type(record_data).__name__}"
+                validation_errors.append(error_msg)
+                logger.warning(f"Validation error: {error_msg}")
+                continue
+            # A malformed issues value is left for pydantic to report
+            issues = record_data.get('issues')
+            if isinstance(issues, (list, tuple)) and 'section_header' in issues:
+                continue
+            event_type = record_data.get('event_type')
+            if event_type is not None and event_type != 'fill':
+                if verbose:
+                    logger.debug(f"Skipping {event_type} record at row {record_data.get('row_index')}")
+                continue
+
+            chunk.append(record_data)
+            if len(chunk) >= self.VALIDATION_CHUNK_SIZE:
+                self._validate_chunk(chunk, successful_records, validation_errors, verbose)
+                chunk = []
+
+        if chunk:
+            self._validate_chunk(chunk, successful_records, validation_errors, verbose)
+
+        if verbose:
+            logger.info(f"Read {records_read} records")
+
+        return successful_records, validation_errors
+
+    def _validate_chunk(
+        self,
+        chunk: List[Dict[str, Any]],
+        successful_records: List[NdjsonRecord],
+        validation_errors: List[str],
+        verbose: bool,
+    ) -> None:
+        """Validate one chunk of candidate fill rows into the given result lists."""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
+            validated = self._records_adapter.validate_python(chunk)
+        except ValidationError:
+            validated = []
+            for record_data in chunk:
+                try:
+                    validated.append(NdjsonRecord.model_validate(record_data))
+                except ValidationError as e:
+                    error_msg = f"Row {record_data.get('row_index', 'unknown')}: {str(e)}"
+                    validation_errors.append(error_msg)
+                    logger.warning(f"Validation error: {error_msg}")
+
+        # Pre-filtering already dropped non-fill event types; this only catches
+        # fills without an exec_time
+        fills = [record for record in validated if record.is_fill]
+        if verbose and len(fills) < len(validated):
+            for record in validated:
+                if not record.is_fill:
+                    logger.debug(f"Skipping non-fill record: {record.event_type}")
+        successful_records.extend(fills)
+
+    def _read_ndjson_file(self, file_path: Path) -> Iterator[Dict[str, Any]]:
+        """Read and parse NDJSON file, yielding one record per line.
+
+        Lines are handed to the parser as raw bytes (both orjson and json take
+        UTF-8 bytes and ignore surrounding whitespace), so nothing is decoded
+        or stripped in Python first.
+        """
+        try:
+            with open(file_path, 'rb') as f:
                 for line_num, line in enumerate(f, 1):
-                    line = line.strip()
-                    if not line:
+                    if not line or line.isspace():
                         continue
 
                     try:
-                        record = json.loads(line)
-                        records.append(record)
+                        record = _json_loads(line)
                     except json.JSONDecodeError as e:
                         logger.error(f"JSON decode error on line {line_num}: {e}")
                         raise IngestionError(f"Invalid JSON on line {line_num}: {e}")
+                    yield record
 
         except FileNotFoundError:
             raise IngestionError(f"File not found: {file_path}")
         except PermissionError:
             raise IngestionError(f"Permission denied reading file: {file_path}")
 
-        return records
-
     def _insert_records(self, user_id: int, records: List[NdjsonRecord], source_file_path: str) -> List[int]:
-        """Insert validated records into database using UPSERT."""
-        inserted_trade_ids = []
+        """
+        Insert validated records into database using UPSERT.
+
+        All rows go through one INSERT ... ON CONFLICT ... RETURNING executed
+        as a single executemany (paged by insertmanyvalues), not a statement
+        per record. Keys are disambiguated as in _insert_records_with_tracking:
+        a repeated key within one executemany would otherwise make Postgres
+        reject the whole statement ("ON CONFLICT DO UPDATE command cannot
+        affect row a second time").
+        """
+        rows = []
+        now = datetime.now()
+        key_occurrences: Dict[str, int] = {}
+        for record in records:
+            trade_data = self._convert_to_trade_data(record, source_file_path, now)
+            trade_data['user_id'] = user_id
+            trade_data['unique_key'] = self._disambiguate_unique_key(
+                trade_data['unique_key'], key_occurrences
+            )
+            rows.append(trade_data)
 
-        with self.db_manager.get_session() as session:
-            for record in records:
-                trade_data = self._convert_to_trade_data(record, source_file_path)
-                trade_data['user_id'] = user_id
+        if not rows:
+            return []
 
-                # Use PostgreSQL UPSERT (INSERT ... ON CONFLICT)
-                stmt = insert(Trade).values(**trade_data)
-                stmt = stmt.on_conflict_do_update(
-                    index_elements=['user_id', 'unique_key'],
-                    set_=dict(
-                        # Update key fields if record already exists
-                        exec_timestamp=stmt.excluded.exec_timestamp,
-                        qty=stmt.excluded.qty,  # Important: update qty to handle signed->unsigned conversion
-                        net_price=stmt.excluded.net_price,
-                        realized_pnl=stmt.excluded.realized_pnl,
-                        # Re-derive classification on every ingest so a parser fix (or a
-                        # corrected re-upload) can heal previously-wrong values (issue #23)
-                        spread_order_tag=stmt.excluded.spread_order_tag,
-                        spread_type=stmt.excluded.spread_type,
-                        processing_timestamp=stmt.excluded.processing_timestamp
-                    )
-                ).returning(Trade.trade_id)
+        self._fill_missing_columns(rows)
 
-                result = session.execute(stmt)
-                trade_id = result.scalar()
-                if trade_id:
-                    inserted_trade_ids.append(trade_id)
+        with self.db_manager.get_session() as session:
+            # Use PostgreSQL UPSERT (INSERT ... ON CONFLICT)
+            inserted_trade_ids = list(session.scalars(_UPSERT_RETURNING_STMT, rows))
 
             # Commit the transaction
             session.commit()
 
         return inserted_trade_ids
 
+    @staticmethod
+    def _copy_columns(rows: List[Dict[str, Any]]) -> Tuple[List[str], Dict[str, Any]]:
+        """
+        Column list for COPYing trade rows, plus values for columns they don't set.
+
+        COPY bypasses SQLAlchemy, so the model's Python-side defaults (e.g.
+        platform_source) have to be written explicitly.
+        """
+        defaults = {
+            trade_column.name: trade_column.default.arg
+            for trade_column in Trade.__table__.columns
+            if trade_column.name not in rows[0]
+            and trade_column.default is not None and trade_column.default.is_scalar
+        }
+        return [*rows[0], *defaults], defaults
+
+    @classmethod
+    def _copy_rows(cls, session: Session, rows: List[Dict[str, Any]], table_name: str) -> None:
+        """
+        Load trade rows into table_name with COPY ... FROM STDIN (psycopg2 only).
+
+        Rows must all have the same keys (see _fill_missing_columns).
+        """
+        cursor = session.connection().connection.cursor()
+        try:
+            columns, defaults = cls._copy_columns(rows)
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
+            for row in rows:
+                writer.writerow([
+                    r"\N" if value is None
+                    else json.dumps(value) if isinstance(value, dict)
+                    else value
+                    for value in (row[c] if c in row else defaults[c] for c in columns)
+                ])
+            buffer.seek(0)
+
+            cursor.copy_expert(
+                f"COPY {table_name} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv, NULL '\\N')",
+                buffer,
+            )
+        finally:
+            cursor.close()
+
+    def _upsert_via_staging(self, session: Session, rows: List[Dict[str, Any]]) -> Optional[Tuple[int, int]]:
+        """
+        UPSERT rows by COPYing them into a temp table and merging with one INSERT ... SELECT.
+
+        Inserts vs updates are counted server-side from the upsert's RETURNING.
+        Returns (insert_count, update_count), or None when the driver can't COPY.
+        """
+        if session.get_bind().dialect.driver != "psycopg2":
+            return None
+
+        columns, _ = self._copy_columns(rows)
+        session.execute(text(
+            f"CREATE TEMP TABLE trades_staging ON COMMIT DROP AS "
+            f"SELECT {', '.join(columns)} FROM trades WITH NO DATA"
+        ))
+        self._copy_rows(session, rows, "trades_staging")
+
+        staging = table_clause("trades_staging", *(column_clause(name) for name in columns))
+        upserted = _TRACKED_UPSERT_STMT.from_select(columns, select(*staging.c)).cte("upserted")
+
+        insert_count, update_count = session.execute(
+            select(
+                func.count().filter(upserted.c.inserted),
+                func.count().filter(~upserted.c.inserted),
+            )
+        ).one()
+        return insert_count, update_count
+
+    @staticmethod
+    def _fill_missing_columns(rows: List[Dict[str, Any]]) -> None:
+        """Give every row the same keys, as executemany requires.
+
+        Optional columns a record didn't set are filled explicitly with NULL;
+        platform_source keeps its model default.
+        """
+        columns = set().union(*rows)
+        for row in rows:
+            for column in columns.difference(row):
+                row[column] = "TOS" if column == "platform_source" else None
+
     def _get_or_create_account(
         self, session: Session, user_id: int, account_number: str, account_name: Optional[str]
     ) -> int:
@@ -293,24 +488,32 @@ class NdjsonIngester:
         self,
         user_id: int,
         records: List[NdjsonRecord],
-        source_file_path: str
+        source_file_path: str,
+        processing_log: Optional[ProcessingLog] = None
     ) -> Tuple[int, int]:
         """
         Insert validated records into database using UPSERT, tracking inserts vs updates.
 
+        Rows go through one INSERT ... ON CONFLICT DO UPDATE executemany whose
+        RETURNING says, per row, whether it was inserted or updated, so no
+        lookup of existing keys is needed. Uploads of COPY_THRESHOLD rows or
+        more are staged with COPY and merged in one statement instead.
+
+        A processing_log, if given, is stamped completed and saved in the same
+        transaction as the trades.
+
         Returns:
             Tuple of (insert_count, update_count)
         """
-        insert_count = 0
-        update_count = 0
-        inserted_trade_ids = []
         key_occurrences: Dict[str, int] = {}
+        rows: List[Dict[str, Any]] = []
+        now = datetime.now()
 
         with self.db_manager.get_session() as session:
             account_cache: Dict[str, int] = {}
 
             for record in records:
-                trade_data = self._convert_to_trade_data(record, source_file_path)
+                trade_data = self._convert_to_trade_data(record, source_file_path, now)
                 trade_data['user_id'] = user_id
                 trade_data['unique_key'] = self._disambiguate_unique_key(
                     trade_data['unique_key'], key_occurrences
@@ -324,68 +527,65 @@ class NdjsonIngester:
                         )
                     trade_data['account_id'] = account_cache[record.account_number]
 
-                # Check if exists first (for tracking)
-                existing = session.query(Trade).filter_by(
-                    user_id=user_id,
-                    unique_key=trade_data['unique_key']
-                ).first()
-
-                is_update = existing is not None
-
-                # Use PostgreSQL UPSERT
-                stmt = insert(Trade).values(**trade_data)
-                stmt = stmt.on_conflict_do_update(
-                    index_elements=['user_id', 'unique_key'],
-                    set_=dict(
-                        exec_timestamp=stmt.excluded.exec_timestamp,
-                        net_price=stmt.excluded.net_price,
-                        realized_pnl=stmt.excluded.realized_pnl,
-                        account_id=stmt.excluded.account_id,
-                        # Re-derive classification on every ingest so a parser fix (or a
-                        # corrected re-upload) can heal previously-wrong values (issue #23)
-                        spread_order_tag=stmt.excluded.spread_order_tag,
-                        spread_type=stmt.excluded.spread_type,
-                        processing_timestamp=stmt.excluded.processing_timestamp
-                    )
-                ).returning(Trade.trade_id)
+                rows.append(trade_data)
 
-                result = session.execute(stmt)
-                trade_id = result.scalar()
+            insert_count = update_count = 0
 
-                if trade_id:
-                    inserted_trade_ids.append(trade_id)
-                    if is_update:
-                        update_count += 1
-                    else:
-                        insert_count += 1
+            if rows:
+                self._fill_missing_columns(rows)
+
+                counts = None
+                if len(rows) >= self.COPY_THRESHOLD:
+                    counts = self._upsert_via_staging(session, rows)
+
+                if counts is None:
+                    # Use PostgreSQL UPSERT; each row reports whether it was inserted
+                    inserted_flags = list(session.scalars(_TRACKED_UPSERT_STMT, rows))
+                    counts = sum(inserted_flags), len(inserted_flags) - sum(inserted_flags)
+
+                insert_count, update_count = counts
+
+            if processing_log is not None:
+                processing_log.processing_completed_at = datetime.now()
+                session.add(processing_log)
 
             # Commit the transaction
             session.commit()
 
         return insert_count, update_count
 
-    def _convert_to_trade_data(self, record: NdjsonRecord, source_file_path: str) -> Dict[str, Any]:
-        """Convert NdjsonRecord to Trade table data."""
+    def _convert_to_trade_data(
+        self,
+        record: NdjsonRecord,
+        source_file_path: str,
+        processing_timestamp: Optional[datetime] = None,
+    ) -> Dict[str, Any]:
+        """Convert NdjsonRecord to Trade table data.
+
+        Batch callers pass one processing_timestamp shared by every row of the
+        file; it defaults to now for one-off conversions.
+        """
+        is_futures = record.is_futures
+        option = record.option if record.is_option else None
 
         # Determine instrument type
-        if record.is_futures:
+        if is_futures:
             instrument_type = "FUTURES"
         elif record.is_option:
             instrument_type = "OPTION"
         else:
             instrument_type = "EQUITY"
 
-        # Handle event type
-        event_type = record.event_type or "fill"  # Default to fill for missing event_type
+        qty = record.qty
 
         trade_data = {
             "unique_key": record.unique_key,
             "exec_timestamp": record.exec_time,
-            "event_type": event_type,
+            "event_type": record.event_type or "fill",  # Default to fill for missing event_type
             "symbol": record.symbol,
             "instrument_type": instrument_type,
             "side": record.side,
-            "qty": abs(record.qty) if record.qty else None,  # Always store as positive
+            "qty": abs(qty) if qty else None,  # Always store as positive
             "pos_effect": record.pos_effect,
             "price": record.price,
             "net_price": record.net_price,
@@ -394,29 +594,24 @@ class NdjsonIngester:
             "source_file_path": source_file_path,
             "source_file_index": record.source_file_index or 0,
             "raw_data": record.raw,
-            "processing_timestamp": datetime.now(),
+            "processing_timestamp": processing_timestamp or datetime.now(),
         }
 
         # Add futures-specific fields (contract expiry for position grouping)
-        if record.is_futures and record.exp:
-            trade_data.update({
-                "exp_date": record.exp,
-                "platform_source": "NINJATRADER",
-            })
+        if is_futures and record.exp:
+            trade_data["exp_date"] = record.exp
+            trade_data["platform_source"] = "NINJATRADER"
 
         # Add option-specific fields
-        if record.is_option and record.option:
-            # Use json round-trip to convert date objects to strings, then store as dict
-            # (psycopg2 needs a plain dict for JSONB, not a json string)
-            option_dict = json.loads(json.dumps(record.option.dict(), default=str))
-            trade_data.update({
-                "exp_date": record.option.exp_date,
-                "strike_price": record.option.strike,
-                "option_type": record.option.right,
-                "spread_type": record.spread,
-                "spread_order_tag": record.spread_order_tag,
-                "option_data": option_dict,
-            })
+        if option:
+            trade_data["exp_date"] = option.exp_date
+            trade_data["strike_price"] = option.strike
+            trade_data["option_type"] = option.right
+            trade_data["spread_type"] = record.spread
+            trade_data["spread_order_tag"] = record.spread_order_tag
+            # JSON-mode dump turns date objects into strings; psycopg2 needs a
+            # plain dict for JSONB, not a json string
+            trade_data["option_data"] = option.model_dump(mode='json')
 
         return trade_data
 
@@ -447,45 +642,11 @@ class NdjsonIngester:
             validation_errors, success, dry_run.
         """
         ul = upload_logger if upload_logger is not None else UploadPerfLogger.noop()
-        user_id = AuthContext.require_user().user_id
-        records_processed = 0
-        records_failed = 0
-        validation_errors = []
-        successful_records = []
-
+        user_id = AuthContext.require_user_id()
         with ul.stage("record_validation", upload_session_id=upload_session_id, user_id=user_id) as ctx:
-            for record_data in records:
-                try:
-                    # Pre-filter header rows and known non-fill types before pydantic validation
-                    # so they don't generate spurious validation errors.
-                    if 'section_header' in record_data.get('issues', []):
-                        continue
-                    event_type = record_data.get('event_type')
-                    if event_type is not None and event_type != 'fill':
-                        if verbose:
-                            logger.debug(f"Skipping {event_type} record at row {record_data.get('row_index')}")
-                        continue
-
-                    record = NdjsonRecord(**record_data)
-
-                    if record.is_section_header:
-                        if verbose:
-                            logger.debug(f"Skipping section header: {record.section}")
-                        continue
-
-                    if not record.is_fill:
-                        if verbose:
-                            logger.debug(f"Skipping non-fill record: {record.event_type}")
-                        continue
-
-                    successful_records.append(record)
-                    records_processed += 1
-
-                except ValidationError as e:
-                    records_failed += 1
-                    error_msg = f"Row {record_data.get('row_index', 'unknown')}: {str(e)}"
-                    validation_errors.append(error_msg)
-                    logger.warning(f"Validation error: {error_msg}")
+            successful_records, validation_errors = self._validate_records(records, verbose)
+            records_processed = len(successful_records)
+            records_failed = len(validation_errors)
 
             ctx['records_valid'] = records_processed
             ctx['records_invalid'] = records_failed
@@ -536,39 +697,72 @@ class NdjsonIngester:
         self,
         file_pattern: str,
         dry_run: bool = False,
-        verbose: bool = False
+        verbose: bool = False,
+        skip_duplicate_check: bool = False
     ) -> Dict[str, Any]:
-        """Process multiple files matching pattern."""
+        """Process multiple files matching pattern.
+
+        Files are read and validated in parallel worker processes (unless there
+        is only one file or one CPU); database writes (and any duplicate
+        prompt) stay in this process, in file order. At most ``max_workers``
+        files are parsed ahead of the one being written, so a large batch
+        doesn't hold every file's parsed records in memory at once.
+        """
 
-        files = list(Path.cwd().glob(file_pattern))
+        files = sorted(Path.cwd().glob(file_pattern))  # Process in deterministic order
 
         if not files:
             raise IngestionError(f"No files found matching pattern: {file_pattern}")
 
         results = []
+        files_succeeded = 0
         total_processed = 0
         total_failed = 0
 
         logger.info(f"Processing {len(files)} files in batch")
 
-        for file_path in sorted(files):  # Process in deterministic order
-            try:
-                result = self.process_file(file_path, dry_run=dry_run, verbose=verbose)
-                results.append(result)
-                total_processed += result["records_processed"]
-                total_failed += result["records_failed"]
-
-            except IngestionError as e:
-                logger.error(f"Failed to process {file_path}: {e}")
-                results.append({
-                    "file_path": str(file_path),
-                    "error": str(e),
-                    "success": False
-                })
+        # A single file isn't worth starting worker processes for
+        max_workers = min(len(files), os.cpu_count() or 1)
+        executor = ProcessPoolExecutor(max_workers=max_workers) if max_workers > 1 else None
+        with executor or nullcontext():
+            pending = iter(files)
+            in_flight = deque()
+
+            def submit_next():
+                file_path = next(pending, None)
+                if file_path is not None:
+                    parsed = executor.submit(_parse_ndjson_file, file_path, verbose) if executor else None
+                    in_flight.append((file_path, parsed))
+
+            for _ in range(max_workers):
+                submit_next()
+
+            while in_flight:
+                # Pop before processing so the finished future (and its records)
+                # can be freed once this file is written
+                file_path, parsed = in_flight.popleft()
+                submit_next()
+                try:
+                    result = self.process_file(
+                        file_path, dry_run=dry_run, verbose=verbose,
+                        skip_duplicate_check=skip_duplicate_check, parsed=parsed
+                    )
+                    results.append(result)
+                    files_succeeded += result["success"]
+                    total_processed += result["records_processed"]
+                    total_failed += result["records_failed"]
+
+                except IngestionError as e:
+                    logger.error(f"Failed to process {file_path}: {e}")
+                    results.append({
+                        "file_path": str(file_path),
+                        "error": str(e),
+                        "success": False
+                    })
 
         batch_result = {
-            "files_processed": len([r for r in results if r.get("success", False)]),
-            "files_failed": len([r for r in results if not r.get("success", False)]),
+            "files_processed": files_succeeded,
+            "files_failed": len(results) - files_succeeded,
             "total_records_processed": total_processed,
             "total_records_failed": total_failed,
             "results": results,
@@ -576,4 +770,10 @@ class NdjsonIngester:
         }
 
         logger.info(f"Batch processing complete: {batch_result}")
-        return batch_result
\ No newline at end of file
+        return batch_result
+
+
+def _parse_ndjson_file(file_path: Path, verbose: bool) -> Tuple[List[NdjsonRecord], List[str]]:
+    """Read and validate one NDJSON file (process_batch worker; must stay module-level)."""
+    ingester = NdjsonIngester()
+    return ingester._validate_records(ingester._read_ndjson_file(file_path), verbose)
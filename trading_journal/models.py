@@ -139,7 +139,7 @@ class Trade(Base):
     # Account relationship
     account_id = Column(BigInteger, ForeignKey("accounts.account_id"), nullable=True)
 
-    unique_key = Column(Text, nullable=False)
+    unique_key = Column(Text, nullable=False, index=True)
 
     # Execution details
     exec_timestamp = Column(TIMESTAMP(timezone=True))
@@ -250,7 +250,7 @@ class CompletedTrade(Base):
     # Relationships
     user = relationship("User", back_populates="completed_trades")
     account = relationship("Account")
-    executions = relationship("Trade", back_populates="completed_trade")
+    executions = relationship("Trade", back_populates="completed_trade", order_by="Trade.exec_timestamp")
     trade_annotation = relationship("TradeAnnotation", uselist=False, back_populates="trade")
 
     @property
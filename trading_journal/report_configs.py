@@ -63,5 +63,5 @@ TRADE_REPORT_LAYOUTS: Dict[str, Dict[str, object]] = {
 }
 
 
-TRADE_SORTABLE_COLUMNS = set(TRADE_COLUMN_DEFS.keys())
+TRADE_SORTABLE_COLUMNS = frozenset(TRADE_COLUMN_DEFS)
 
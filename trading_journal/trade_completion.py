@@ -7,10 +7,10 @@ from typing import List, Dict, Any, Optional, Tuple
 from decimal import Decimal
 
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, func, text
+from sqlalchemy import and_, func, or_, text, tuple_
 
 from .database import db_manager
-from .models import Trade, CompletedTrade, TradeAnnotation
+from .models import Trade, CompletedTrade, TradeAnnotation, SetupPattern
 from .authorization import AuthContext
 from .positions import get_contract_multiplier
 
@@ -182,7 +182,7 @@ class TradeCompletionEngine:
 
     def process_completed_trades(self, symbol: Optional[str] = None) -> Dict[str, Any]:
         """Identify and process completed trades from unlinked executions."""
-        user_id = AuthContext.require_user().user_id
+        user_id = AuthContext.require_user_id()
 
         with self.db_manager.get_session() as session:
             # Get fill trades that aren't linked to completed trades yet
@@ -566,51 +566,125 @@ class TradeCompletionEngine:
         self,
         symbol: Optional[str] = None,
         start_date: Optional[date] = None,
-        end_date: Optional[date] = None
+        end_date: Optional[date] = None,
+        limit: Optional[int] = None,
+        after_id: Optional[int] = None,
     ) -> Dict[str, Any]:
-        """Get summary of completed trades with optional filtering."""
-        user_id = AuthContext.require_user().user_id
-
-        with self.db_manager.get_session() as session:
-            query = session.query(CompletedTrade).filter(
-                CompletedTrade.user_id == user_id
-            )
+        """
+        Get summary of completed trades with optional filtering.
 
-            if symbol:
-                query = query.filter(CompletedTrade.symbol == symbol)
+        Summary statistics are aggregated in SQL over every matching trade.
+        The ``trades`` list is returned newest-first and can be paged with
+        ``limit``/``after_id`` (keyset pagination on
+        ``(coalesce(opened_at, closed_at), id)``, trades with neither time
+        last); ``next_after_id`` is set when another page is available.
+        """
+        user_id = AuthContext.require_user_id()
 
-            # Apply date filters
-            if start_date:
-                query = query.filter(CompletedTrade.closed_at >= start_date)
-            if end_date:
-                # Include the entire end date (through end of day)
-                query = query.filter(CompletedTrade.closed_at < datetime.combine(
-                    end_date, datetime.max.time()
-                ))
+        filters = [CompletedTrade.user_id == user_id]
+        if symbol:
+            filters.append(CompletedTrade.symbol == symbol)
 
-            completed_trades = query.all()
+        # Apply date filters
+        if start_date:
+            filters.append(CompletedTrade.closed_at >= start_date)
+        if end_date:
+            # Include the entire end date (through end of day)
+            filters.append(CompletedTrade.closed_at < datetime.combine(
+                end_date, datetime.max.time()
+            ))
 
-            if not completed_trades:
+        with self.db_manager.get_session() as session:
+            is_win = CompletedTrade.is_winning_trade.is_(True)
+            is_loss = CompletedTrade.is_winning_trade.isnot(True)
+            totals = session.query(
+                func.count().label("total"),
+                func.count().filter(is_win).label("wins"),
+                func.coalesce(func.sum(CompletedTrade.net_pnl), 0).label("total_pnl"),
+                func.avg(CompletedTrade.net_pnl).filter(is_win).label("avg_win"),
+                func.avg(CompletedTrade.net_pnl).filter(is_loss).label("avg_loss"),
+            ).filter(*filters).one()
+
+            if not totals.total:
                 return {"message": "No completed trades found"}
 
-            winning_trades = [t for t in completed_trades if t.is_winning_trade]
-            losing_trades = [t for t in completed_trades if not t.is_winning_trade]
+            # Project only the columns the summary reports on; pattern name and
+            # notes come from outer joins instead of per-trade relationship loads.
+            query = session.query(
+                CompletedTrade.completed_trade_id,
+                CompletedTrade.instrument_type,
+                CompletedTrade.symbol,
+                CompletedTrade.trade_type,
+                CompletedTrade.total_qty,
+                CompletedTrade.entry_avg_price,
+                CompletedTrade.exit_avg_price,
+                CompletedTrade.net_pnl,
+                CompletedTrade.opened_at,
+                CompletedTrade.closed_at,
+                SetupPattern.pattern_name,
+                TradeAnnotation.trade_notes,
+            ).outerjoin(
+                TradeAnnotation,
+                TradeAnnotation.completed_trade_id == CompletedTrade.completed_trade_id
+            ).outerjoin(
+                SetupPattern,
+                SetupPattern.pattern_id == TradeAnnotation.setup_pattern_id
+            ).filter(*filters)
+
+            # opened_at can be NULL; a row comparison against NULL is never
+            # true, so the key falls back to closed_at and still-NULL keys
+            # sort (and page) last
+            sort_time = func.coalesce(CompletedTrade.opened_at, CompletedTrade.closed_at)
+            if after_id is not None:
+                anchor = session.query(
+                    sort_time.label("sort_time"), CompletedTrade.completed_trade_id
+                ).filter(
+                    CompletedTrade.completed_trade_id == after_id,
+                    CompletedTrade.user_id == user_id,
+                ).one_or_none()
+                if anchor is None:
+                    raise ValueError(f"Completed trade with ID {after_id} not found")
+                if anchor.sort_time is None:
+                    query = query.filter(
+                        sort_time.is_(None),
+                        CompletedTrade.completed_trade_id < anchor.completed_trade_id,
+                    )
+                else:
+                    query = query.filter(or_(
+                        tuple_(sort_time, CompletedTrade.completed_trade_id)
+                        < tuple_(anchor.sort_time, anchor.completed_trade_id),
+                        sort_time.is_(None),
+                    ))
+
+            query = query.order_by(
+                sort_time.desc().nulls_last(), CompletedTrade.completed_trade_id.desc()
+            )
+            if limit:
+                # Fetch one extra row to tell whether another page exists
+                page = query.limit(limit + 1).all()
+                has_more = len(page) > limit
+                page = page[:limit]
+            else:
+                page = query.all()
+                has_more = False
 
-            total_pnl = sum(t.net_pnl for t in completed_trades)
-            win_rate = len(winning_trades) / len(completed_trades) * 100 if completed_trades else 0
+            winning_count = totals.wins
+            losing_count = totals.total - winning_count
+            win_rate = winning_count / totals.total * 100
 
-            avg_win = sum(t.net_pnl for t in winning_trades) / len(winning_trades) if winning_trades else 0
-            avg_loss = sum(t.net_pnl for t in losing_trades) / len(losing_trades) if losing_trades else 0
+            avg_win = totals.avg_win if winning_count else 0
+            avg_loss = totals.avg_loss if losing_count else 0
 
             return {
-                "total_trades": len(completed_trades),
-                "winning_trades": len(winning_trades),
-                "losing_trades": len(losing_trades),
+                "total_trades": totals.total,
+                "winning_trades": winning_count,
+                "losing_trades": losing_count,
                 "win_rate": win_rate,
-                "total_pnl": total_pnl,
+                "total_pnl": totals.total_pnl,
                 "average_win": avg_win,
                 "average_loss": avg_loss,
                 "profit_factor": abs(avg_win / avg_loss) if avg_loss != 0 else float('inf'),
+                "next_after_id": page[-1].completed_trade_id if has_more else None,
                 "trades": [
                     {
                         "id": t.completed_trade_id,
@@ -623,9 +697,9 @@ class TradeCompletionEngine:
                         "pnl": t.net_pnl,
                         "opened_at": t.opened_at.isoformat() if t.opened_at else None,
                         "closed_at": t.closed_at.isoformat() if t.closed_at else None,
-                        "setup_pattern": (t.trade_annotation.setup_pattern_rel.pattern_name if t.trade_annotation and t.trade_annotation.setup_pattern_rel else None),
-                        "notes": (t.trade_annotation.trade_notes if t.trade_annotation else None)
+                        "setup_pattern": t.pattern_name,
+                        "notes": t.trade_notes
                     }
-                    for t in completed_trades
+                    for t in page
                 ]
             }
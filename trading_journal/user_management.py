@@ -2,9 +2,9 @@
 
 import re
 from datetime import datetime
-from typing import List, Dict, Any, Tuple, Optional
+from typing import Iterator, List, Dict, Any, Tuple, Optional
 
-from sqlalchemy import func
+from sqlalchemy import delete, func, select, Row
 from sqlalchemy.orm import Session
 
 from .models import User, CompletedTrade, Trade, Position, SetupPattern, SetupSource, ProcessingLog
@@ -28,11 +28,76 @@ class UserManager:
         """
         self.session = session
 
+    # Tables purged by purge_user_data, in delete order (trades reference completed_trades)
+    PURGE_TABLES = (
+        ('trades', Trade),
+        ('completed_trades', CompletedTrade),
+        ('positions', Position),
+        ('setup_patterns', SetupPattern),
+        ('setup_sources', SetupSource),
+        ('processing_log', ProcessingLog),
+    )
+
+    # Column order of the rows yielded by stream_user_rows (and of CSV exports)
+    EXPORT_COLUMNS = (
+        'user_id', 'username', 'email', 'is_active', 'is_admin',
+        'trade_count', 'created_at', 'last_login_at'
+    )
+
+    @staticmethod
+    def _trade_counts_subquery():
+        # Count trades per user first so the join adds one narrow row per user
+        # instead of grouping every joined trade row by all the user columns.
+        return select(
+            CompletedTrade.user_id,
+            func.count().label('trade_count')
+        ).group_by(CompletedTrade.user_id).subquery()
+
+    def _users_query(self, include_inactive: bool):
+        """Build the users-with-trade-counts query shared by list_users and iter_users."""
+        trade_counts = self._trade_counts_subquery()
+
+        query = self.session.query(
+            User.user_id,
+            User.username,
+            User.email,
+            User.is_active,
+            User.is_admin,
+            User.timezone,
+            User.created_at,
+            User.last_login_at,
+            func.coalesce(trade_counts.c.trade_count, 0).label('trade_count')
+        ).outerjoin(
+            trade_counts,
+            trade_counts.c.user_id == User.user_id
+        )
+
+        # Filter by active status if requested
+        if not include_inactive:
+            query = query.filter(User.is_active == True)
+
+        return query
+
+    @staticmethod
+    def _user_row_to_dict(row) -> Dict[str, Any]:
+        """Convert a users-query row into the dict shape returned by list_users."""
+        return {
+            'user_id': row.user_id,
+            'username': row.username,
+            'email': row.email,
+            'is_active': row.is_active,
+            'is_admin': row.is_admin,
+            'timezone': row.timezone or 'US/Eastern',
+            'trade_count': row.trade_count,
+            'created_at': row.created_at,
+            'last_login_at': row.last_login_at
+        }
+
     def list_users(self, include_inactive: bool = False) -> List[Dict[str, Any]]:
         """
         List all users with their trade counts using efficient database aggregation.
 
-        Uses a single query with LEFT JOIN and GROUP BY to avoid N+1 query problems.
+        Uses a single query joining per-user trade counts to avoid N+1 query problems.
 
         Args:
             include_inactive: If True, include inactive users. Default False.
@@ -42,52 +107,42 @@ class UserManager:
             Each dict has: user_id, username, email, is_active, is_admin,
                           trade_count, created_at, last_login_at
         """
-        # Build query with database-level aggregation
-        query = self.session.query(
-            User.user_id,
-            User.username,
-            User.email,
-            User.is_active,
-            User.is_admin,
-            User.timezone,
-            User.created_at,
-            User.last_login_at,
-            func.count(CompletedTrade.completed_trade_id).label('trade_count')
-        ).outerjoin(
-            CompletedTrade,
-            CompletedTrade.user_id == User.user_id
-        ).group_by(
+        return [self._user_row_to_dict(row) for row in self._users_query(include_inactive).all()]
+
+    def iter_users(self, include_inactive: bool = False, batch_size: int = 500) -> Iterator[Dict[str, Any]]:
+        """
+        Yield the same dicts as list_users, fetching rows in batches of batch_size.
+
+        Intended for exports: memory stays flat regardless of the number of users.
+        """
+        for row in self._users_query(include_inactive).yield_per(batch_size):
+            yield self._user_row_to_dict(row)
+
+    def stream_user_rows(self, include_inactive: bool = False, batch_size: int = 1000) -> Iterator[Row]:
+        """
+        Yield plain Core rows in EXPORT_COLUMNS order from a server-side cursor.
+
+        Skips ORM query/dict overhead entirely; used for CSV exports.
+        """
+        trade_counts = self._trade_counts_subquery()
+        stmt = select(
             User.user_id,
             User.username,
             User.email,
             User.is_active,
             User.is_admin,
-            User.timezone,
+            func.coalesce(trade_counts.c.trade_count, 0).label('trade_count'),
             User.created_at,
             User.last_login_at
-        )
+        ).outerjoin(
+            trade_counts,
+            trade_counts.c.user_id == User.user_id
+        ).execution_options(yield_per=batch_size)
 
-        # Filter by active status if requested
         if not include_inactive:
-            query = query.filter(User.is_active == True)
+            stmt = stmt.where(User.is_active == True)
 
-        # Execute query and format results
-        results = query.all()
-
-        return [
-            {
-                'user_id': row.user_id,
-                'username': row.username,
-                'email': row.email,
-                'is_active': row.is_active,
-                'is_admin': row.is_admin,
-                'timezone': row.timezone or 'US/Eastern',
-                'trade_count': row.trade_count,
-                'created_at': row.created_at,
-                'last_login_at': row.last_login_at
-            }
-            for row in results
-        ]
+        yield from self.session.execute(stmt)
 
     def create_user(
         self,
@@ -339,52 +394,25 @@ class UserManager:
         # Verify user exists
         user = self.get_user_or_raise(user_id)
 
-        # Count records in each table
-        counts = {
-            'trades': self.session.query(func.count(Trade.trade_id)).filter(
-                Trade.user_id == user_id
-            ).scalar() or 0,
-            'completed_trades': self.session.query(func.count(CompletedTrade.completed_trade_id)).filter(
-                CompletedTrade.user_id == user_id
-            ).scalar() or 0,
-            'positions': self.session.query(func.count(Position.position_id)).filter(
-                Position.user_id == user_id
-            ).scalar() or 0,
-            'setup_patterns': self.session.query(func.count(SetupPattern.pattern_id)).filter(
-                SetupPattern.user_id == user_id
-            ).scalar() or 0,
-            'setup_sources': self.session.query(func.count(SetupSource.source_id)).filter(
-                SetupSource.user_id == user_id
-            ).scalar() or 0,
-            'processing_log': self.session.query(func.count(ProcessingLog.log_id)).filter(
-                ProcessingLog.user_id == user_id
-            ).scalar() or 0
-        }
-
-        counts['total'] = sum(counts.values())
-
-        # If dry-run, return counts without deleting
         if dry_run:
-            return counts
-
-        # Delete in order (respecting foreign key constraints)
-        # 1. Trades first (they reference completed_trades)
-        self.session.query(Trade).filter(Trade.user_id == user_id).delete(synchronize_session=False)
-
-        # 2. Completed trades
-        self.session.query(CompletedTrade).filter(CompletedTrade.user_id == user_id).delete(synchronize_session=False)
-
-        # 3. Positions
-        self.session.query(Position).filter(Position.user_id == user_id).delete(synchronize_session=False)
-
-        # 4. Setup patterns
-        self.session.query(SetupPattern).filter(SetupPattern.user_id == user_id).delete(synchronize_session=False)
-
-        # 5. Setup sources
-        self.session.query(SetupSource).filter(SetupSource.user_id == user_id).delete(synchronize_session=False)
+            # Count records in each table (one round trip: a scalar subquery per table)
+            row = self.session.execute(select(*(
+                select(func.count()).select_from(model).where(model.user_id == user_id)
+                .scalar_subquery().label(name)
+                for name, model in self.PURGE_TABLES
+            ))).one()
+            counts = dict(row._mapping)
+        else:
+            # One bulk DELETE per table, in FK-safe order; counts come from rowcount
+            counts = {
+                name: self.session.execute(
+                    delete(model).where(model.user_id == user_id),
+                    execution_options={"synchronize_session": False},
+                ).rowcount
+                for name, model in self.PURGE_TABLES
+            }
 
-        # 6. Processing log
-        self.session.query(ProcessingLog).filter(ProcessingLog.user_id == user_id).delete(synchronize_session=False)
+        counts['total'] = sum(counts.values())
 
         # Note: User account is preserved, only data is deleted
 
@@ -54,7 +54,7 @@ def upload():
             flash('No valid files to process.', 'warning')
             return redirect(url_for('ingest.upload_form'))
 
-        user_id = AuthContext.require_user().user_id
+        user_id = AuthContext.require_user_id()
         total_file_bytes = sum(os.path.getsize(p) for p in saved_paths)
 
         ul.event('upload_received', {
@@ -4,6 +4,7 @@ import zoneinfo
 from datetime import timezone as dt_timezone
 
 from flask import Blueprint, flash, redirect, render_template, request, url_for
+from sqlalchemy import update as sa_update
 
 from ..auth import login_required
 from ...authorization import AuthContext
@@ -98,15 +99,16 @@ def update(note_id):
     body = request.form.get('body', '').strip() or None
 
     with db_manager.get_session() as session:
-        note = session.query(JournalNote).filter(
-            JournalNote.note_id == note_id,
-            JournalNote.user_id == user.user_id,
-        ).first()
-        if note is None:
+        # Single UPDATE ... RETURNING: ownership check and write in one round trip
+        updated_id = session.execute(
+            sa_update(JournalNote)
+            .where(JournalNote.note_id == note_id, JournalNote.user_id == user.user_id)
+            .values(title=title, body=body)
+            .returning(JournalNote.note_id)
+        ).scalar_one_or_none()
+        if updated_id is None:
             flash('Note not found.', 'danger')
             return redirect(url_for('journal.index'))
-        note.title = title
-        note.body = body
         session.commit()
 
     flash('Note saved.', 'success')
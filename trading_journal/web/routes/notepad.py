@@ -4,6 +4,7 @@ import zoneinfo
 from datetime import timezone as dt_timezone
 
 from flask import Blueprint, flash, redirect, render_template, request, url_for
+from sqlalchemy import update as sa_update
 
 from ..auth import login_required
 from ...annotation_service import merge_notepad_entry
@@ -166,15 +167,16 @@ def update(notepad_id):
             account_id = None
 
     with db_manager.get_session() as session:
-        entry = session.query(NotepadEntry).filter_by(
-            notepad_id=notepad_id, user_id=user.user_id
-        ).one_or_none()
-        if entry is None:
+        # Single UPDATE ... RETURNING: ownership check and write in one round trip
+        updated_id = session.execute(
+            sa_update(NotepadEntry)
+            .where(NotepadEntry.notepad_id == notepad_id, NotepadEntry.user_id == user.user_id)
+            .values(symbol=symbol, account_id=account_id, body=body)
+            .returning(NotepadEntry.notepad_id)
+        ).scalar_one_or_none()
+        if updated_id is None:
             flash('Notepad entry not found.', 'danger')
             return redirect(url_for('notepad.index'))
-        entry.symbol = symbol
-        entry.account_id = account_id
-        entry.body = body
         session.commit()
 
     flash('Notepad entry saved.', 'success')
@@ -4,8 +4,8 @@ import zoneinfo
 from datetime import timezone as dt_timezone
 
 from flask import Blueprint, flash, redirect, render_template, request, session, url_for
-from sqlalchemy import and_, asc, desc, or_
-from sqlalchemy.orm import joinedload
+from sqlalchemy import and_, asc, desc, or_, select
+from sqlalchemy.orm import joinedload, load_only
 
 from ..auth import login_required
 from ...annotation_service import get_or_create_annotation as _get_or_create_annotation
@@ -152,13 +152,11 @@ def index():
         )
 
         # Fetch user patterns for filter dropdown (from setup_patterns table)
-        pattern_names_rows = (
-            db_session.query(SetupPattern.pattern_name)
-            .filter_by(user_id=user.user_id, is_active=True)
+        pattern_names = db_session.scalars(
+            select(SetupPattern.pattern_name)
+            .where(SetupPattern.user_id == user.user_id, SetupPattern.is_active == True)
             .order_by(SetupPattern.pattern_name)
-            .all()
-        )
-        pattern_names = [p[0] for p in pattern_names_rows]
+        ).all()
 
         # Fetch user accounts for filter dropdown
         accounts = (
@@ -250,7 +248,7 @@ def detail(trade_id: int):
             flash('Trade not found.', 'warning')
             return redirect(url_for('trades.index'))
 
-        executions = sorted(trade.executions, key=lambda e: e.exec_timestamp or '')
+        executions = trade.executions  # ordered by exec_timestamp via the relationship
 
         annotation = db_session.query(TradeAnnotation).filter_by(
             completed_trade_id=trade_id
@@ -258,8 +256,11 @@ def detail(trade_id: int):
 
         # Notepad entries already merged into this trade — matched by FK, falling back to
         # the natural key in case a completed_trades rebuild nulled the FK (see NotepadEntry).
+        # Only the id, body and capture time are rendered for either notes list.
+        note_columns = load_only(NotepadEntry.notepad_id, NotepadEntry.body, NotepadEntry.created_at)
         matched_notes = (
             db_session.query(NotepadEntry)
+            .options(note_columns)
             .filter(
                 NotepadEntry.user_id == user.user_id,
                 or_(
@@ -282,6 +283,7 @@ def detail(trade_id: int):
         # Unmatched entries eligible to attach here — no symbol set, or symbol matches this trade
         unmatched_notes = (
             db_session.query(NotepadEntry)
+            .options(note_columns)
             .filter(
                 NotepadEntry.user_id == user.user_id,
                 NotepadEntry.matched_trade_id.is_(None),
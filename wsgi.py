@@ -8,8 +8,18 @@ Usage:
   uv run gunicorn --bind 0.0.0.0:5000 --workers 2 wsgi:app
 """
 
+import os
+
 from dotenv import load_dotenv
-load_dotenv()  # populate os.environ from .env before anything else runs
+
+from trading_journal.config_manager import DOTENV_LOADED_ENV_VAR
+
+# Populate os.environ from .env before anything else runs. Child processes
+# (the Flask reloader, re-exec'd workers) inherit the environment, so skip the
+# re-parse there; existing env vars always win over .env values.
+if not os.environ.get(DOTENV_LOADED_ENV_VAR):
+    load_dotenv(override=False)
+    os.environ[DOTENV_LOADED_ENV_VAR] = "1"
 
 from trading_journal.web import create_app
 